@@ -20,201 +20,225 @@
 
 """REST API blueprint."""
 
-from typing import Type
+from typing import List, Optional
 
 from flask import Blueprint, current_app
-from flask_caching import Cache
 from webargs import fields, validate
+from werkzeug.utils import import_string
 
 from ..const import API_PREFIX
 from .auth import jwt_required_ifauth
+from .cache import thumbnail_cache
 from .file import LocalFileHandler
-from .resources.base import Resource
-from .resources.bookmarks import BookmarkResource, BookmarksResource
-from .resources.citations import CitationResource, CitationsResource
-from .resources.events import EventResource, EventSpanResource, EventsResource
-from .resources.exporters import (
-    ExporterFileResource,
-    ExporterResource,
-    ExportersResource,
-)
-from .resources.facts import FactsResource
-from .resources.families import FamiliesResource, FamilyResource
-from .resources.filters import FilterResource, FiltersResource, FiltersResources
-from .resources.holidays import HolidayResource, HolidaysResource
-from .resources.living import LivingDatesResource, LivingResource
-from .resources.media import MediaObjectResource, MediaObjectsResource
-from .resources.metadata import MetadataResource
-from .resources.name_formats import NameFormatsResource
-from .resources.name_groups import NameGroupsResource
-from .resources.notes import NoteResource, NotesResource
-from .resources.people import PeopleResource, PersonResource
-from .resources.places import PlaceResource, PlacesResource
-from .resources.relations import RelationResource, RelationsResource
-from .resources.reports import ReportFileResource, ReportResource, ReportsResource
-from .resources.repositories import RepositoriesResource, RepositoryResource
-from .resources.search import SearchResource
-from .resources.sources import SourceResource, SourcesResource
-from .resources.tags import TagResource, TagsResource
-from .resources.timeline import (
-    FamilyTimelineResource,
-    PersonTimelineResource,
-    TimelineFamiliesResource,
-    TimelinePeopleResource,
-)
-from .resources.token import TokenRefreshResource, TokenResource
-from .resources.translations import TranslationResource, TranslationsResource
-from .resources.types import (
-    CustomTypeResource,
-    CustomTypesResource,
-    DefaultTypeMapResource,
-    DefaultTypeResource,
-    DefaultTypesResource,
-    TypesResource,
-)
-from .resources.user import (
-    UserChangePasswordResource,
-    UserResetPasswordResource,
-    UserResource,
-    UsersResource,
-    UserTriggerResetPasswordResource,
-)
 from .util import make_cache_key_thumbnails, use_args
 
+_RESOURCES = "gramps_webapi.api.resources"
+
 api_blueprint = Blueprint("api", __name__, url_prefix=API_PREFIX)
-thumbnail_cache = Cache()
 
 
-def register_endpt(resource: Type[Resource], url: str, name: str):
-    """Register an endpoint."""
-    api_blueprint.add_url_rule(url, view_func=resource.as_view(name))
+class LazyView:
+    """View that imports its resource class on first dispatch.
 
+    Deferring the resource imports keeps the heavy `gramps.gen` modules
+    out of the blueprint import and speeds up app start-up.
+    """
 
-# Token
-register_endpt(TokenResource, "/token/", "token")
-register_endpt(TokenRefreshResource, "/token/refresh/", "token_refresh")
-# People
-register_endpt(
-    PersonTimelineResource, "/people/<string:handle>/timeline", "person-timeline"
-)
-register_endpt(PersonResource, "/people/<string:handle>", "person")
-register_endpt(PeopleResource, "/people/", "people")
-# Families
-register_endpt(
-    FamilyTimelineResource, "/families/<string:handle>/timeline", "family-timeline"
-)
-register_endpt(FamilyResource, "/families/<string:handle>", "family")
-register_endpt(FamiliesResource, "/families/", "families")
-# Events
-register_endpt(
-    EventSpanResource, "/events/<string:handle1>/span/<string:handle2>", "event-span"
-)
-register_endpt(EventResource, "/events/<string:handle>", "event")
-register_endpt(EventsResource, "/events/", "events")
-# Timelines
-register_endpt(TimelinePeopleResource, "/timelines/people/", "timeline-people")
-register_endpt(TimelineFamiliesResource, "/timelines/families/", "timeline-families")
-# Places
-register_endpt(PlaceResource, "/places/<string:handle>", "place")
-register_endpt(PlacesResource, "/places/", "places")
-# Citations
-register_endpt(CitationResource, "/citations/<string:handle>", "citation")
-register_endpt(CitationsResource, "/citations/", "citations")
-# Sources
-register_endpt(SourceResource, "/sources/<string:handle>", "source")
-register_endpt(SourcesResource, "/sources/", "sources")
-# Repositories
-register_endpt(RepositoryResource, "/repositories/<string:handle>", "repository")
-register_endpt(RepositoriesResource, "/repositories/", "repositories")
-# Media
-register_endpt(MediaObjectResource, "/media/<string:handle>", "media_object")
-register_endpt(MediaObjectsResource, "/media/", "media_objects")
-# Notes
-register_endpt(NoteResource, "/notes/<string:handle>", "note")
-register_endpt(NotesResource, "/notes/", "notes")
-# Tags
-register_endpt(TagResource, "/tags/<string:handle>", "tag")
-register_endpt(TagsResource, "/tags/", "tags")
-# Types
-register_endpt(CustomTypeResource, "/types/custom/<string:datatype>", "custom-type")
-register_endpt(CustomTypesResource, "/types/custom/", "custom-types")
-register_endpt(
-    DefaultTypeMapResource, "/types/default/<string:datatype>/map", "default-type-map"
-)
-register_endpt(DefaultTypeResource, "/types/default/<string:datatype>", "default-type")
-register_endpt(DefaultTypesResource, "/types/default/", "default-types")
-register_endpt(TypesResource, "/types/", "types")
-# Name Formats
-register_endpt(NameFormatsResource, "/name-formats/", "name-formats")
-# Name Groups
-register_endpt(
-    NameGroupsResource, "/name-groups/<string:surname>/<string:group>", "set-name-group"
-)
-register_endpt(NameGroupsResource, "/name-groups/<string:surname>", "get-name-group")
-register_endpt(NameGroupsResource, "/name-groups/", "name-groups")
-# Bookmarks
-register_endpt(BookmarkResource, "/bookmarks/<string:namespace>", "bookmark")
-register_endpt(BookmarksResource, "/bookmarks/", "bookmarks")
-# Filters
-register_endpt(FilterResource, "/filters/<string:namespace>/<string:name>", "filter")
-register_endpt(FiltersResource, "/filters/<string:namespace>", "filters-namespace")
-register_endpt(FiltersResources, "/filters/", "filters")
-# Translations
-register_endpt(TranslationResource, "/translations/<string:language>", "translation")
-register_endpt(TranslationsResource, "/translations/", "translations")
-# Relations
-register_endpt(
-    RelationResource, "/relations/<string:handle1>/<string:handle2>", "relation",
-)
-register_endpt(
-    RelationsResource, "/relations/<string:handle1>/<string:handle2>/all", "relations",
-)
-# Living
-register_endpt(LivingDatesResource, "/living/<string:handle>/dates", "living-dates")
-register_endpt(LivingResource, "/living/<string:handle>", "living")
-# Reports
-register_endpt(ReportFileResource, "/reports/<string:report_id>/file", "report-file")
-register_endpt(ReportResource, "/reports/<string:report_id>", "report")
-register_endpt(ReportsResource, "/reports/", "reports")
-# Facts
-register_endpt(FactsResource, "/facts/", "facts")
-# Exporters
-register_endpt(
-    ExporterFileResource, "/exporters/<string:extension>/file", "exporter-file"
-)
-register_endpt(ExporterResource, "/exporters/<string:extension>", "exporter")
-register_endpt(ExportersResource, "/exporters/", "exporters")
-# Holidays
-register_endpt(
-    HolidayResource,
-    "/holidays/<string:country>/<int:year>/<int:month>/<int:day>",
-    "holiday",
-)
-register_endpt(HolidaysResource, "/holidays/", "holidays")
-# Metadata
-register_endpt(MetadataResource, "/metadata/", "metadata")
-# User
-register_endpt(
-    UsersResource, "/users/", "users",
-)
-register_endpt(
-    UserResource, "/users/<string:user_name>/", "user",
-)
-register_endpt(
-    UserChangePasswordResource,
-    "/users/<string:user_name>/password/change",
-    "change_password",
-)
-register_endpt(
-    UserResetPasswordResource, "/users/-/password/reset/", "reset_password",
-)
-register_endpt(
-    UserTriggerResetPasswordResource,
-    "/users/<string:user_name>/password/reset/trigger/",
-    "trigger_reset_password",
+    def __init__(self, import_name: str, name: str):
+        """Store the import path of the resource class and the view name."""
+        self.import_name = import_name
+        self.name = name
+        self.view = None
+        # used by Flask and extensions to identify the view
+        self.__name__ = name
+
+    def __call__(self, *args, **kwargs):
+        """Resolve the view on first call and dispatch to it."""
+        if self.view is None:
+            self.view = import_string(self.import_name).as_view(self.name)
+        return self.view(*args, **kwargs)
+
+
+def register_endpt(
+    resource: str, url: str, name: str, methods: Optional[List[str]] = None
+):
+    """Register an endpoint given the import path of its resource class."""
+    api_blueprint.add_url_rule(
+        url,
+        endpoint=name,
+        view_func=LazyView("{}.{}".format(_RESOURCES, resource), name),
+        methods=methods or ["GET"],
+    )
+
+
+# Static table of API routes: (resource class, URL rule, endpoint name[, methods])
+_ROUTES = (
+    # Token
+    ("token.TokenResource", "/token/", "token", ["POST"]),
+    ("token.TokenRefreshResource", "/token/refresh/", "token_refresh", ["POST"]),
+    # People
+    (
+        "timeline.PersonTimelineResource",
+        "/people/<string:handle>/timeline",
+        "person-timeline",
+    ),
+    ("people.PersonResource", "/people/<string:handle>", "person"),
+    ("people.PeopleResource", "/people/", "people"),
+    # Families
+    (
+        "timeline.FamilyTimelineResource",
+        "/families/<string:handle>/timeline",
+        "family-timeline",
+    ),
+    ("families.FamilyResource", "/families/<string:handle>", "family"),
+    ("families.FamiliesResource", "/families/", "families"),
+    # Events
+    (
+        "events.EventSpanResource",
+        "/events/<string:handle1>/span/<string:handle2>",
+        "event-span",
+    ),
+    ("events.EventResource", "/events/<string:handle>", "event"),
+    ("events.EventsResource", "/events/", "events"),
+    # Timelines
+    ("timeline.TimelinePeopleResource", "/timelines/people/", "timeline-people"),
+    ("timeline.TimelineFamiliesResource", "/timelines/families/", "timeline-families"),
+    # Places
+    ("places.PlaceResource", "/places/<string:handle>", "place"),
+    ("places.PlacesResource", "/places/", "places"),
+    # Citations
+    ("citations.CitationResource", "/citations/<string:handle>", "citation"),
+    ("citations.CitationsResource", "/citations/", "citations"),
+    # Sources
+    ("sources.SourceResource", "/sources/<string:handle>", "source"),
+    ("sources.SourcesResource", "/sources/", "sources"),
+    # Repositories
+    ("repositories.RepositoryResource", "/repositories/<string:handle>", "repository"),
+    ("repositories.RepositoriesResource", "/repositories/", "repositories"),
+    # Media
+    ("media.MediaObjectResource", "/media/<string:handle>", "media_object"),
+    ("media.MediaObjectsResource", "/media/", "media_objects"),
+    # Notes
+    ("notes.NoteResource", "/notes/<string:handle>", "note"),
+    ("notes.NotesResource", "/notes/", "notes"),
+    # Tags
+    ("tags.TagResource", "/tags/<string:handle>", "tag"),
+    ("tags.TagsResource", "/tags/", "tags"),
+    # Types
+    ("types.CustomTypeResource", "/types/custom/<string:datatype>", "custom-type"),
+    ("types.CustomTypesResource", "/types/custom/", "custom-types"),
+    (
+        "types.DefaultTypeMapResource",
+        "/types/default/<string:datatype>/map",
+        "default-type-map",
+    ),
+    ("types.DefaultTypeResource", "/types/default/<string:datatype>", "default-type"),
+    ("types.DefaultTypesResource", "/types/default/", "default-types"),
+    ("types.TypesResource", "/types/", "types"),
+    # Name Formats
+    ("name_formats.NameFormatsResource", "/name-formats/", "name-formats"),
+    # Name Groups
+    (
+        "name_groups.NameGroupsResource",
+        "/name-groups/<string:surname>/<string:group>",
+        "set-name-group",
+        ["GET", "POST"],
+    ),
+    (
+        "name_groups.NameGroupsResource",
+        "/name-groups/<string:surname>",
+        "get-name-group",
+        ["GET", "POST"],
+    ),
+    ("name_groups.NameGroupsResource", "/name-groups/", "name-groups", ["GET", "POST"]),
+    # Bookmarks
+    ("bookmarks.BookmarkResource", "/bookmarks/<string:namespace>", "bookmark"),
+    ("bookmarks.BookmarksResource", "/bookmarks/", "bookmarks"),
+    # Filters
+    (
+        "filters.FilterResource",
+        "/filters/<string:namespace>/<string:name>",
+        "filter",
+        ["GET", "DELETE"],
+    ),
+    (
+        "filters.FiltersResource",
+        "/filters/<string:namespace>",
+        "filters-namespace",
+        ["GET", "POST", "PUT"],
+    ),
+    ("filters.FiltersResources", "/filters/", "filters"),
+    # Translations
+    (
+        "translations.TranslationResource",
+        "/translations/<string:language>",
+        "translation",
+    ),
+    ("translations.TranslationsResource", "/translations/", "translations"),
+    # Relations
+    (
+        "relations.RelationResource",
+        "/relations/<string:handle1>/<string:handle2>",
+        "relation",
+    ),
+    (
+        "relations.RelationsResource",
+        "/relations/<string:handle1>/<string:handle2>/all",
+        "relations",
+    ),
+    # Living
+    ("living.LivingDatesResource", "/living/<string:handle>/dates", "living-dates"),
+    ("living.LivingResource", "/living/<string:handle>", "living"),
+    # Reports
+    ("reports.ReportFileResource", "/reports/<string:report_id>/file", "report-file"),
+    ("reports.ReportResource", "/reports/<string:report_id>", "report"),
+    ("reports.ReportsResource", "/reports/", "reports"),
+    # Facts
+    ("facts.FactsResource", "/facts/", "facts"),
+    # Exporters
+    (
+        "exporters.ExporterFileResource",
+        "/exporters/<string:extension>/file",
+        "exporter-file",
+    ),
+    ("exporters.ExporterResource", "/exporters/<string:extension>", "exporter"),
+    ("exporters.ExportersResource", "/exporters/", "exporters"),
+    # Holidays
+    (
+        "holidays.HolidayResource",
+        "/holidays/<string:country>/<int:year>/<int:month>/<int:day>",
+        "holiday",
+    ),
+    ("holidays.HolidaysResource", "/holidays/", "holidays"),
+    # Metadata
+    ("metadata.MetadataResource", "/metadata/", "metadata"),
+    # User
+    ("user.UsersResource", "/users/", "users"),
+    ("user.UserResource", "/users/<string:user_name>/", "user", ["GET", "POST", "PUT"]),
+    (
+        "user.UserChangePasswordResource",
+        "/users/<string:user_name>/password/change",
+        "change_password",
+        ["POST"],
+    ),
+    (
+        "user.UserResetPasswordResource",
+        "/users/-/password/reset/",
+        "reset_password",
+        ["GET", "POST"],
+    ),
+    (
+        "user.UserTriggerResetPasswordResource",
+        "/users/<string:user_name>/password/reset/trigger/",
+        "trigger_reset_password",
+        ["POST"],
+    ),
+    # Search
+    ("search.SearchResource", "/search/", "search"),
 )
-# Search
-register_endpt(SearchResource, "/search/", "search")
+
+for _route in _ROUTES:
+    register_endpt(*_route)
 
 # Media files
 @api_blueprint.route("/media/<string:handle>/file")
@@ -0,0 +1,54 @@
+#
+# Gramps Web API - A RESTful API for the Gramps genealogy program
+#
+# Copyright (C) 2021      David Straub
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+#
+
+"""Caches for API responses."""
+
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+from flask_caching import Cache
+
+thumbnail_cache = Cache()
+request_cache = Cache()
+
+DB_VALUE_TTL = 300
+
+_db_values: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_db_values_lock = threading.Lock()
+
+
+def get_db_value_cached(db_handle, method_name: str) -> Any:
+    """Return the result of a slow database method, cached per database.
+
+    Used for values like the database summary or the surname list that
+    scan large parts of the database but rarely change. Entries expire
+    after `DB_VALUE_TTL` seconds.
+    """
+    key = (db_handle.get_dbid(), method_name)
+    now = time.time()
+    with _db_values_lock:
+        entry = _db_values.get(key)
+    if entry is not None and now - entry[0] < DB_VALUE_TTL:
+        return entry[1]
+    value = getattr(db_handle, method_name)()
+    with _db_values_lock:
+        _db_values[key] = (now, value)
+    return value
@@ -57,12 +57,13 @@ class GrampsObjectResourceHelper(GrampsJSONEncoder):
         self, obj: GrampsObject, args: Dict, locale: GrampsLocale = glocale
     ) -> GrampsObject:
         """Get the full object with extended attributes and backlinks."""
+        db_handle = self.db_handle
         if args.get("backlinks"):
-            obj.backlinks = get_backlinks(self.db_handle, obj.handle)
+            obj.backlinks = get_backlinks(db_handle, obj.handle)
         if args.get("soundex"):
             if self.gramps_class_name not in ["Person", "Family"]:
                 abort(422)
-            obj.soundex = get_soundex(self.db_handle, obj, self.gramps_class_name)
+            obj.soundex = get_soundex(db_handle, obj, self.gramps_class_name)
         obj = self.object_extend(obj, args, locale=locale)
         if args.get("profile") and (
             "all" in args["profile"] or "references" in args["profile"]
@@ -71,7 +72,7 @@ class GrampsObjectResourceHelper(GrampsJSONEncoder):
                 # create profile if doesn't exist
                 obj.profile = {}
             obj.profile["references"] = get_reference_profile_for_object(
-                self.db_handle, obj, locale=locale
+                db_handle, obj, locale=locale
             )
         return obj
 
@@ -264,6 +265,7 @@ class GrampsObjectsResource(GrampsObjectResourceHelper, Resource):
     def get(self, args: Dict) -> Response:
         """Get all objects."""
         locale = get_locale_for_language(args["locale"], default=True)
+        db_handle = self.db_handle
         if "gramps_id" in args:
             obj = self.get_object_from_gramps_id(args["gramps_id"])
             if obj is None:
@@ -272,16 +274,14 @@ class GrampsObjectsResource(GrampsObjectResourceHelper, Resource):
                 200, [self.full_object(obj, args, locale=locale)], args, total_items=1
             )
 
-        query_method = self.db_handle.method("get_%s_handles", self.gramps_class_name)
+        query_method = db_handle.method("get_%s_handles", self.gramps_class_name)
         if self.gramps_class_name in ["Event", "Repository", "Note"]:
             handles = query_method()
         else:
             handles = query_method(sort_handles=True, locale=locale)
 
         if "filter" in args or "rules" in args:
-            handles = apply_filter(
-                self.db_handle, args, self.gramps_class_name, handles
-            )
+            handles = apply_filter(db_handle, args, self.gramps_class_name, handles)
 
         if args["dates"]:
             handles = self.match_dates(handles, args["dates"])
@@ -295,11 +295,8 @@ class GrampsObjectsResource(GrampsObjectResourceHelper, Resource):
             offset = (args["page"] - 1) * args["pagesize"]
             handles = handles[offset : offset + args["pagesize"]]
 
-        query_method = self.db_handle.method(
-            "get_%s_from_handle", self.gramps_class_name
-        )
-        return self.response(
-            200,
+        query_method = db_handle.method("get_%s_from_handle", self.gramps_class_name)
+        return self.stream_response(
             [
                 self.full_object(query_method(handle), args, locale=locale)
                 for handle in handles
@@ -25,47 +25,33 @@ from typing import Dict, List, Optional, Union
 from flask import Response, abort
 from gramps.gen.db.base import DbReadBase
 
-from ..util import get_db_handle, use_args
+from ..cache import request_cache
+from ..util import get_db_handle, make_cache_key_request, use_args
 from . import ProtectedResource
 from .emit import GrampsJSONEncoder
 
-_BOOKMARK_TYPES = [
-    "citations",
-    "events",
-    "families",
-    "media",
-    "notes",
-    "people",
-    "places",
-    "repositories",
-    "sources",
-]
+_BOOKMARK_METHODS = {
+    "citations": "get_citation_bookmarks",
+    "events": "get_event_bookmarks",
+    "families": "get_family_bookmarks",
+    "media": "get_media_bookmarks",
+    "notes": "get_note_bookmarks",
+    "people": "get_bookmarks",
+    "places": "get_place_bookmarks",
+    "repositories": "get_repo_bookmarks",
+    "sources": "get_source_bookmarks",
+}
+
+_BOOKMARK_TYPES = list(_BOOKMARK_METHODS)
 
 
 def get_bookmarks(db_handle: DbReadBase, namespace: str) -> Optional[List]:
     """Return bookmarks for a namespace."""
-    result = None
-    if namespace == "people":
-        result = db_handle.get_bookmarks()
-    elif namespace == "families":
-        result = db_handle.get_family_bookmarks()
-    elif namespace == "media":
-        result = db_handle.get_media_bookmarks()
-    elif namespace == "events":
-        result = db_handle.get_event_bookmarks()
-    elif namespace == "citations":
-        result = db_handle.get_citation_bookmarks()
-    elif namespace == "notes":
-        result = db_handle.get_note_bookmarks()
-    elif namespace == "places":
-        result = db_handle.get_place_bookmarks()
-    elif namespace == "sources":
-        result = db_handle.get_source_bookmarks()
-    elif namespace == "repositories":
-        result = db_handle.get_repo_bookmarks()
-    if result is None:
+    try:
+        query_method = getattr(db_handle, _BOOKMARK_METHODS[namespace])
+    except KeyError:
         abort(404)
-    return result.get()
+    return query_method().get()
 
 
 class BookmarkResource(ProtectedResource, GrampsJSONEncoder):
@@ -91,6 +77,10 @@ class BookmarksResource(ProtectedResource, GrampsJSONEncoder):
         return get_db_handle()
 
     @use_args({}, location="query")
+    @request_cache.cached(
+        make_cache_key=make_cache_key_request,
+        response_filter=lambda rv: rv.status_code == 200,
+    )
     def get(self, args: Dict) -> Response:
         """Get the list of bookmark types."""
         result = {}
@@ -20,14 +20,17 @@
 
 """Gramps Json Encoder."""
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional
 
 import gramps.gen.lib as lib
-from flask import Response, current_app, json
+import orjson
+from flask import Response, current_app, request, stream_with_context
 from gramps.gen.db import DbBookmarks
 from gramps.gen.lib.baseobj import BaseObject
 from werkzeug.datastructures import Headers
 
+_ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
 
 def default(obj: Any):
     """Handle unserializable objects."""
@@ -46,17 +49,8 @@ class GrampsJSONEncoder:
         self.filter_only_keys = []
         self.filter_skip_keys = []
 
-    def response(
-        self,
-        status: int = 200,
-        payload: Optional[Any] = None,
-        args: Optional[Dict] = None,
-        total_items: int = -1,
-    ) -> Response:
-        """Prepare response."""
-        if payload is None:
-            payload = {}
-        args = args or {}
+    def _set_filters(self, args: Dict) -> None:
+        """Set the key filters from the request arguments."""
         if "strip" in args:
             self.strip_empty_keys = args["strip"]
         else:
@@ -70,23 +64,76 @@ class GrampsJSONEncoder:
         else:
             self.filter_skip_keys = []
 
+    @staticmethod
+    def _get_headers(total_items: int) -> Optional[Headers]:
+        """Return the response headers."""
         if total_items > -1:
             headers = Headers()
             headers.add("X-Total-Count", total_items)
-        else:
-            headers = None
+            return headers
+        return None
 
-        return Response(
+    def response(
+        self,
+        status: int = 200,
+        payload: Optional[Any] = None,
+        args: Optional[Dict] = None,
+        total_items: int = -1,
+    ) -> Response:
+        """Prepare response."""
+        if payload is None:
+            payload = {}
+        self._set_filters(args or {})
+        res = Response(
             status=status,
-            headers=headers,
-            response=json.dumps(
+            headers=self._get_headers(total_items),
+            response=orjson.dumps(
                 self.extract_objects(payload),
-                ensure_ascii=False,
-                sort_keys=True,
+                option=_ORJSON_OPTIONS,
                 default=default,
             ),
             mimetype="application/json",
         )
+        if status == 200:
+            # the entity tag covers the serialized body, so it also
+            # reflects per-user differences like private record filtering
+            res.add_etag()
+            return res.make_conditional(request)
+        return res
+
+    def stream_response(
+        self,
+        payload: Iterable[Any],
+        args: Optional[Dict] = None,
+        total_items: int = -1,
+    ) -> Response:
+        """Prepare a streamed response for a list of objects.
+
+        The objects are extracted up front, so extraction errors still
+        surface before the response starts; only the serialization is
+        streamed, one object at a time, instead of building the full
+        JSON string in memory.
+        """
+        self._set_filters(args or {})
+        extracted = [self.extract_objects(obj) for obj in payload]
+
+        def generate():
+            yield b"["
+            first = True
+            for obj in extracted:
+                if first:
+                    first = False
+                else:
+                    yield b","
+                yield orjson.dumps(obj, option=_ORJSON_OPTIONS, default=default)
+            yield b"]"
+
+        return Response(
+            stream_with_context(generate()),
+            status=200,
+            headers=self._get_headers(total_items),
+            mimetype="application/json",
+        )
 
     def is_null(self, value: Any) -> bool:
         """Test for empty value."""
@@ -21,7 +21,8 @@
 """Gramps filter interface."""
 
 import json
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import gramps.gen.filters as filters
 from flask import Response, abort
@@ -49,24 +50,35 @@ _RULES_LOOKUP = {
 }
 
 
+@lru_cache(maxsize=32)
+def list_filter_rules(namespace: str) -> Tuple[Dict, ...]:
+    """List the available filter rules for a namespace.
+
+    The rule classes never change at runtime, so the result is cached
+    to avoid introspecting them on every request.
+    """
+    return tuple(
+        {
+            "category": rule_class.category,
+            "description": rule_class.description,
+            "labels": rule_class.labels,
+            "name": rule_class.name,
+            "rule": rule_class.__name__,
+        }
+        for rule_class in _RULES_LOOKUP[namespace]
+    )
+
+
 def get_filter_rules(args: Dict[str, Any], namespace: str) -> List[Dict]:
     """Return a list of available filter rules for a namespace."""
     rule_list = []
-    for rule_class in _RULES_LOOKUP[namespace]:
+    for rule in list_filter_rules(namespace):
         add_rule = True
         if "rules" in args and args["rules"]:
-            if rule_class.__name__ not in args["rules"]:
+            if rule["rule"] not in args["rules"]:
                 add_rule = False
         if add_rule:
-            rule_list.append(
-                {
-                    "category": rule_class.category,
-                    "description": rule_class.description,
-                    "labels": rule_class.labels,
-                    "name": rule_class.name,
-                    "rule": rule_class.__name__,
-                }
-            )
+            rule_list.append(rule)
     if "rules" in args and len(args["rules"]) != len(rule_list):
         abort(404)
     return rule_list
@@ -31,10 +31,13 @@ from pkg_resources import resource_filename
 
 from gramps_webapi.const import VERSION
 
-from ..util import get_db_handle
+from ..cache import get_db_value_cached, request_cache
+from ..util import get_db_handle, make_cache_key_request
 from . import ProtectedResource
 from .emit import GrampsJSONEncoder
 
+APISPEC_FILE = resource_filename("gramps_webapi", "data/apispec.yaml")
+
 
 class MetadataResource(ProtectedResource, GrampsJSONEncoder):
     """Metadata resource."""
@@ -44,6 +47,10 @@ class MetadataResource(ProtectedResource, GrampsJSONEncoder):
         """Get the database instance."""
         return get_db_handle()
 
+    @request_cache.cached(
+        make_cache_key=make_cache_key_request,
+        response_filter=lambda rv: rv.status_code == 200,
+    )
     def get(self) -> Response:
         """Get active database and application related metadata information."""
         catalog = GRAMPS_LOCALE.get_language_dict()
@@ -63,13 +70,24 @@ class MetadataResource(ProtectedResource, GrampsJSONEncoder):
                 if key == db_key:
                     db_type = db_summary[0][key]
 
-        with open(
-            resource_filename("gramps_webapi", "data/apispec.yaml")
-        ) as file_handle:
+        with open(APISPEC_FILE) as file_handle:
             schema = yaml.safe_load(file_handle)
 
+        database = {"id": db_handle.get_dbid(), "name": db_name, "type": db_type}
+        data = get_db_value_cached(db_handle, "get_summary")
+        db_version_key = GRAMPS_LOCALE.translation.sgettext("Database version")
+        db_module_key = GRAMPS_LOCALE.translation.sgettext("Database module version")
+        db_schema_key = GRAMPS_LOCALE.translation.sgettext("Schema version")
+        for item in data:
+            if item == db_version_key:
+                database["version"] = data[item]
+            elif item == db_module_key:
+                database["module"] = data[item]
+            elif item == db_schema_key:
+                database["schema"] = data[item]
+
         result = {
-            "database": {"id": db_handle.get_dbid(), "name": db_name, "type": db_type,},
+            "database": database,
             "default_person": db_handle.get_default_handle(),
             "gramps": {"version": ENV["VERSION"],},
             "gramps_webapi": {"schema": schema["info"]["version"], "version": VERSION,},
@@ -94,17 +112,6 @@ class MetadataResource(ProtectedResource, GrampsJSONEncoder):
                 "tags": db_handle.get_number_of_tags(),
             },
             "researcher": db_handle.get_researcher(),
-            "surnames": db_handle.get_surname_list(),
+            "surnames": get_db_value_cached(db_handle, "get_surname_list"),
         }
-        data = db_handle.get_summary()
-        db_version_key = GRAMPS_LOCALE.translation.sgettext("Database version")
-        db_module_key = GRAMPS_LOCALE.translation.sgettext("Database module version")
-        db_schema_key = GRAMPS_LOCALE.translation.sgettext("Schema version")
-        for item in data:
-            if item == db_version_key:
-                result["database"]["version"] = data[item]
-            elif item == db_module_key:
-                result["database"]["module"] = data[item]
-            elif item == db_schema_key:
-                result["database"]["schema"] = data[item]
         return self.response(200, result)
@@ -34,6 +34,7 @@ from .base import (
 )
 from .util import (
     get_extended_attributes,
+    get_families_by_handles,
     get_family_by_handle,
     get_person_profile_for_object,
 )
@@ -55,20 +56,32 @@ class PersonResourceHelper(GrampsObjectResourceHelper):
             )
         if "extend" in args:
             obj.extended = get_extended_attributes(db_handle, obj, args)
-            if "all" in args["extend"] or "family_list" in args["extend"]:
-                obj.extended["families"] = [
-                    get_family_by_handle(db_handle, handle)
-                    for handle in obj.family_list
-                ]
-            if "all" in args["extend"] or "parent_family_list" in args["extend"]:
-                obj.extended["parent_families"] = [
-                    get_family_by_handle(db_handle, handle)
-                    for handle in obj.parent_family_list
-                ]
-            if "all" in args["extend"] or "primary_parent_family" in args["extend"]:
-                obj.extended["primary_parent_family"] = get_family_by_handle(
-                    db_handle, obj.get_main_parents_family_handle()
+            do_all = "all" in args["extend"]
+            if do_all or "family_list" in args["extend"]:
+                obj.extended["families"] = get_families_by_handles(
+                    db_handle, obj.family_list
                 )
+            parent_families = None
+            if do_all or "parent_family_list" in args["extend"]:
+                parent_families = get_families_by_handles(
+                    db_handle, obj.parent_family_list
+                )
+                obj.extended["parent_families"] = parent_families
+            if do_all or "primary_parent_family" in args["extend"]:
+                primary_handle = obj.get_main_parents_family_handle()
+                primary_parent_family = None
+                if parent_families is not None:
+                    # the primary parent family has usually been fetched
+                    # already as part of the parent families
+                    for family in parent_families:
+                        if family.handle == primary_handle:
+                            primary_parent_family = family
+                            break
+                if primary_parent_family is None:
+                    primary_parent_family = get_family_by_handle(
+                        db_handle, primary_handle
+                    )
+                obj.extended["primary_parent_family"] = primary_parent_family
         return obj
 
 
@@ -20,8 +20,10 @@
 
 """Types API resource."""
 
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+import orjson
 from flask import Response, abort
 from gramps.gen.db.base import DbReadBase
 from gramps.gen.lib.attrtype import AttributeType
@@ -120,6 +122,20 @@ def get_default_types(datatype: str, locale: bool = False) -> Optional[List]:
     return result
 
 
+@lru_cache(maxsize=2)
+def get_default_types_json(locale: bool) -> bytes:
+    """Return the serialized default types response.
+
+    The default types are constant for the lifetime of the process, so
+    the JSON body is serialized only once per locale flag.
+    """
+    result = {
+        datatype: get_default_types(datatype, locale)
+        for datatype in _DEFAULT_RECORD_TYPES
+    }
+    return orjson.dumps(result, option=orjson.OPT_SORT_KEYS)
+
+
 def get_custom_types(db_handle: DbReadBase, datatype: str) -> Optional[List]:
     """Return list of types for a custom record type."""
     result = None
@@ -169,10 +185,9 @@ class DefaultTypesResource(ProtectedResource, GrampsJSONEncoder):
     )
     def get(self, args: Dict) -> Response:
         """Return a list of available default types."""
-        result = {}
-        for datatype in _DEFAULT_RECORD_TYPES:
-            result.update({datatype: get_default_types(datatype, args["locale"])})
-        return self.response(200, result)
+        return Response(
+            get_default_types_json(args["locale"]), mimetype="application/json"
+        )
 
 
 class DefaultTypeResource(ProtectedResource, GrampsJSONEncoder):
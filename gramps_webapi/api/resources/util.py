@@ -20,8 +20,10 @@
 #
 
 """Gramps utility functions."""
-from typing import Any, Dict, List, Optional, Tuple, Union
+import pickle
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
+from flask import g, has_request_context
 from gramps.gen.const import GRAMPS_LOCALE as glocale
 from gramps.gen.db.base import DbReadBase
 from gramps.gen.display.name import NameDisplay
@@ -32,13 +34,17 @@ from gramps.gen.lib import (
     Event,
     Family,
     Media,
+    Note,
     Person,
     Place,
     PlaceType,
+    Repository,
     Source,
     Span,
+    Tag,
 )
 from gramps.gen.lib.primaryobj import BasicPrimaryObject as GrampsObject
+from gramps.gen.proxy.proxybase import ProxyDbBase
 from gramps.gen.soundex import soundex
 from gramps.gen.utils.db import (
     get_birth_or_fallback,
@@ -89,6 +95,110 @@ def get_family_by_handle(
     return obj
 
 
+def get_objects_by_handles(
+    db_handle: DbReadBase, handles: Sequence[Handle], gramps_class_name: str
+) -> List[GrampsObject]:
+    """Get objects for a list of handles, using a single query if possible.
+
+    Handles that do not exist in the database are silently skipped.
+    """
+    if not handles:
+        return []
+    obj_class = {
+        "Citation": Citation,
+        "Event": Event,
+        "Family": Family,
+        "Media": Media,
+        "Note": Note,
+        "Person": Person,
+        "Repository": Repository,
+        "Tag": Tag,
+    }.get(gramps_class_name)
+    if isinstance(db_handle, ProxyDbBase) or obj_class is None:
+        # proxy DBs filter objects on access, so a direct SQL query would
+        # bypass them: fall back to per-handle queries
+        dbapi = None
+    else:
+        dbapi = getattr(db_handle, "dbapi", None)
+    if dbapi is None:
+        query_method = db_handle.method("get_%s_from_handle", gramps_class_name)
+        objects = []
+        for handle in handles:
+            try:
+                objects.append(query_method(handle))
+            except HandleError:
+                continue
+        return objects
+    placeholders = ",".join("?" * len(handles))
+    dbapi.execute(
+        "SELECT handle, blob_data FROM {} WHERE handle IN ({})".format(
+            gramps_class_name.lower(), placeholders
+        ),
+        list(handles),
+    )
+    rows = {row[0]: row[1] for row in dbapi.fetchall()}
+    # reorder to preserve the original handle order
+    return [
+        obj_class.create(pickle.loads(rows[handle]))
+        for handle in handles
+        if handle in rows
+    ]
+
+
+def get_events_by_handles(
+    db_handle: DbReadBase, handles: Sequence[Handle]
+) -> List[Event]:
+    """Get events for a list of handles with a single query."""
+    return get_objects_by_handles(db_handle, handles, "Event")
+
+
+def get_media_by_handles(
+    db_handle: DbReadBase, handles: Sequence[Handle]
+) -> List[Media]:
+    """Get media objects for a list of handles with a single query."""
+    return get_objects_by_handles(db_handle, handles, "Media")
+
+
+def get_people_by_handles(
+    db_handle: DbReadBase, handles: Sequence[Handle]
+) -> List[Person]:
+    """Get people for a list of handles with a single query."""
+    return get_objects_by_handles(db_handle, handles, "Person")
+
+
+def get_repositories_by_handles(
+    db_handle: DbReadBase, handles: Sequence[Handle]
+) -> List[Repository]:
+    """Get repositories for a list of handles with a single query."""
+    return get_objects_by_handles(db_handle, handles, "Repository")
+
+
+def get_citations_by_handles(
+    db_handle: DbReadBase, handles: Sequence[Handle]
+) -> List[Citation]:
+    """Get citations for a list of handles with a single query."""
+    return get_objects_by_handles(db_handle, handles, "Citation")
+
+
+def get_notes_by_handles(
+    db_handle: DbReadBase, handles: Sequence[Handle]
+) -> List[Note]:
+    """Get notes for a list of handles with a single query."""
+    return get_objects_by_handles(db_handle, handles, "Note")
+
+
+def get_tags_by_handles(db_handle: DbReadBase, handles: Sequence[Handle]) -> List[Tag]:
+    """Get tags for a list of handles with a single query."""
+    return get_objects_by_handles(db_handle, handles, "Tag")
+
+
+def get_families_by_handles(
+    db_handle: DbReadBase, handles: Sequence[Handle]
+) -> List[Family]:
+    """Get families for a list of handles with a single query."""
+    return get_objects_by_handles(db_handle, handles, "Family")
+
+
 def get_source_by_handle(
     db_handle: DbReadBase, handle: Handle, args: Optional[Dict] = None
 ) -> Source:
@@ -352,7 +462,26 @@ def get_place_profile_for_handle(
 def get_person_profile_for_object(
     db_handle: DbReadBase, person: Person, args: List, locale: GrampsLocale = glocale
 ) -> Person:
-    """Get person profile given a Person."""
+    """Get person profile given a Person.
+
+    Profiles are cached for the duration of the request: on list
+    endpoints, spouses, parents and children recur in many profiles.
+    """
+    if not has_request_context():
+        return _get_person_profile_for_object(db_handle, person, args, locale=locale)
+    cache = g.setdefault("_person_profile_cache", {})
+    key = (person.handle, tuple(args), locale.lang)
+    if key not in cache:
+        cache[key] = _get_person_profile_for_object(
+            db_handle, person, args, locale=locale
+        )
+    return cache[key]
+
+
+def _get_person_profile_for_object(
+    db_handle: DbReadBase, person: Person, args: List, locale: GrampsLocale = glocale
+) -> Person:
+    """Build the profile for a person."""
     options = []
     if "all" in args or "ratings" in args:
         options.append("ratings")
@@ -567,8 +696,17 @@ def get_media_profile_for_handle(
 def get_extended_attributes(
     db_handle: DbReadBase, obj: GrampsObject, args: Optional[Dict] = None
 ) -> Dict:
-    """Get extended attributes for a GrampsObject."""
+    """Get extended attributes for a GrampsObject.
+
+    Only the attributes requested via the `extend` argument are
+    computed; returns an empty dict if none were requested.
+    """
     args = args or {}
+    if not args.get("extend"):
+        return {}
+    # The individual fetches are intentionally serial: the database
+    # connection behind `db_handle` (and its proxies) is shared and not
+    # safe for concurrent use from multiple threads.
     result = {}
     do_all = False
     if "all" in args["extend"]:
@@ -576,46 +714,35 @@ def get_extended_attributes(
     if (do_all or "child_ref_list" in args["extend"]) and hasattr(
         obj, "child_ref_list"
     ):
-        result["children"] = [
-            db_handle.get_person_from_handle(child_ref.ref)
-            for child_ref in obj.child_ref_list
-        ]
+        result["children"] = get_people_by_handles(
+            db_handle, [child_ref.ref for child_ref in obj.child_ref_list]
+        )
     if (do_all or "citation_list" in args["extend"]) and hasattr(obj, "citation_list"):
-        result["citations"] = [
-            db_handle.get_citation_from_handle(handle) for handle in obj.citation_list
-        ]
+        result["citations"] = get_citations_by_handles(db_handle, obj.citation_list)
     if (do_all or "event_ref_list" in args["extend"]) and hasattr(
         obj, "event_ref_list"
     ):
-        result["events"] = [
-            db_handle.get_event_from_handle(event_ref.ref)
-            for event_ref in obj.event_ref_list
-        ]
+        result["events"] = get_events_by_handles(
+            db_handle, [event_ref.ref for event_ref in obj.event_ref_list]
+        )
     if (do_all or "media_list" in args["extend"]) and hasattr(obj, "media_list"):
-        result["media"] = [
-            db_handle.get_media_from_handle(media_ref.ref)
-            for media_ref in obj.media_list
-        ]
+        result["media"] = get_media_by_handles(
+            db_handle, [media_ref.ref for media_ref in obj.media_list]
+        )
     if (do_all or "note_list" in args["extend"]) and hasattr(obj, "note_list"):
-        result["notes"] = [
-            db_handle.get_note_from_handle(handle) for handle in obj.note_list
-        ]
+        result["notes"] = get_notes_by_handles(db_handle, obj.note_list)
     if (do_all or "person_ref_list" in args["extend"]) and hasattr(
         obj, "person_ref_list"
     ):
-        result["people"] = [
-            db_handle.get_person_from_handle(person_ref.ref)
-            for person_ref in obj.person_ref_list
-        ]
+        result["people"] = get_people_by_handles(
+            db_handle, [person_ref.ref for person_ref in obj.person_ref_list]
+        )
     if (do_all or "reporef_list" in args["extend"]) and hasattr(obj, "reporef_list"):
-        result["repositories"] = [
-            db_handle.get_repository_from_handle(repo_ref.ref)
-            for repo_ref in obj.reporef_list
-        ]
+        result["repositories"] = get_repositories_by_handles(
+            db_handle, [repo_ref.ref for repo_ref in obj.reporef_list]
+        )
     if (do_all or "tag_list" in args["extend"]) and hasattr(obj, "tag_list"):
-        result["tags"] = [
-            db_handle.get_tag_from_handle(handle) for handle in obj.tag_list
-        ]
+        result["tags"] = get_tags_by_handles(db_handle, obj.tag_list)
     if (do_all or "backlinks" in args["extend"]) and hasattr(obj, "backlinks"):
         result["backlinks"] = {}
         for class_name, backlinks in obj.backlinks.items():
@@ -33,6 +33,7 @@ from gramps.gen.const import GRAMPS_LOCALE
 from gramps.gen.db.base import DbReadBase
 from gramps.gen.errors import HandleError
 from gramps.gen.proxy import PrivateProxyDb
+from gramps.gen.proxy.cache import CacheProxyDb
 from gramps.gen.utils.file import expand_media_path
 from gramps.gen.utils.grampslocale import GrampsLocale
 from marshmallow import RAISE
@@ -88,16 +89,24 @@ def get_db_handle() -> DbReadBase:
     If a user is not authorized to view private records,
     returns a proxy DB instance.
     """
+    try:
+        # fast path: handle already constructed for this request
+        return g.db_handle
+    except AttributeError:
+        pass
     if "dbstate" not in g:
         # cache the DbState instance for the duration of
         # the request
         dbmgr = current_app.config["DB_MANAGER"]
         g.dbstate = dbmgr.get_db()
+    # cache handle lookups for the duration of the request
+    db_handle = CacheProxyDb(g.dbstate.db)
     if not has_permissions({PERM_VIEW_PRIVATE}):
         # if we're not authorized to view private records,
         # return a proxy DB instead of the real one
-        return ModifiedPrivateProxyDb(g.dbstate.db)
-    return g.dbstate.db
+        db_handle = ModifiedPrivateProxyDb(db_handle)
+    g.db_handle = db_handle
+    return db_handle
 
 
 def get_media_base_dir():
@@ -169,6 +178,19 @@ def send_email(
         raise ValueError("Error while trying to send e-mail.")
 
 
+def make_cache_key_request(*args, **kwargs):
+    """Make a cache key for a read-only endpoint response.
+
+    The key includes whether the user may view private records, so
+    users with different views of the database don't share entries.
+    """
+    args_as_sorted_tuple = tuple(sorted(request.args.items(multi=True)))
+    args_as_bytes = str(args_as_sorted_tuple).encode()
+    arg_hash = hashlib.md5(args_as_bytes).hexdigest()
+    view_private = has_permissions({PERM_VIEW_PRIVATE})
+    return "{}:{}:{}".format(request.path, arg_hash, view_private)
+
+
 def make_cache_key_thumbnails(*args, **kwargs):
     """Make a cache key for thumbnails."""
     # hash query args except jwt
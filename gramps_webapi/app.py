@@ -28,7 +28,8 @@ from flask_compress import Compress
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager
 
-from .api import api_blueprint, thumbnail_cache
+from .api import api_blueprint
+from .api.cache import request_cache, thumbnail_cache
 from .api.resources.token import limiter
 from .api.search import SearchIndexer
 from .auth import SQLAuth
@@ -70,6 +71,7 @@ def create_app(db_manager=None):
         app.config["AUTH_PROVIDER"] = SQLAuth(db_uri=app.config["USER_DB_URI"])
 
     thumbnail_cache.init_app(app, config=app.config["THUMBNAIL_CACHE_CONFIG"])
+    request_cache.init_app(app, config=app.config["REQUEST_CACHE_CONFIG"])
 
     # search indexer
     app.config["SEARCH_INDEXER"] = SearchIndexer(app.config["SEARCH_INDEX_DIR"])
@@ -115,4 +117,13 @@ def create_app(db_manager=None):
         if dbstate and dbstate.is_open():
             dbstate.db.close()
 
+    # open & close the DB once per worker up front, so the first
+    # request does not pay for plugin registration and schema checks
+    @app.before_first_request
+    def warm_db() -> None:
+        """Warm the database caches."""
+        dbstate = app.config["DB_MANAGER"].get_db()
+        if dbstate.is_open():
+            dbstate.db.close()
+
     return app
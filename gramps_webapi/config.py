@@ -42,6 +42,10 @@ class DefaultConfig(object):
         "CACHE_DIR": "thumbnail_cache",
         "CACHE_THRESHOLD": 1000,
     }
+    REQUEST_CACHE_CONFIG = {
+        "CACHE_TYPE": "simple",
+        "CACHE_DEFAULT_TIMEOUT": 300,
+    }
 
 
 class DefaultConfigJWT(object):
@@ -39,6 +39,7 @@ REQUIREMENTS = [
     "Flask-Limiter",
     "webargs",
     "SQLAlchemy",
+    "orjson",
     "pdf2image",
     "Pillow",
     "bleach",
@@ -132,3 +132,18 @@ class ExampleDbSQLite(ExampleDbBase, WebDbManager):
         smgr.do_reg_plugins(dbstate, uistate=None)
         self.path, self.name = dbman.import_new_db(self.path, User())
         WebDbManager.__init__(self, self.name)
+        self._dbstate = None
+
+    def get_db(self, lock: bool = False, force_unlock: bool = False) -> DbState:
+        """Open the example database once and share it across requests.
+
+        The API opens the database before and closes it after every
+        request; for the read-only example database that is pure
+        overhead in the test suite, so the close is disarmed and the
+        same DbState instance is reused instead.
+        """
+        if self._dbstate is None:
+            dbstate = WebDbManager.get_db(self, lock=lock, force_unlock=force_unlock)
+            dbstate.db.close = lambda *args, **kwargs: None
+            self._dbstate = dbstate
+        return self._dbstate
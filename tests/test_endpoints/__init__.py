@@ -24,6 +24,7 @@ import importlib
 import os
 import shutil
 import tempfile
+from functools import lru_cache
 from unittest.mock import patch
 
 import gramps.gen.const
@@ -31,18 +32,41 @@ import yaml
 from jsonschema import RefResolver
 from pkg_resources import resource_filename
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 import gramps_webapi.app
+from gramps_webapi.api.search import SearchIndexer
 from gramps_webapi.app import create_app
 from gramps_webapi.auth.const import ROLE_EDITOR, ROLE_GUEST, ROLE_MEMBER, ROLE_OWNER
 from gramps_webapi.const import ENV_CONFIG_FILE, TEST_EXAMPLE_GRAMPS_AUTH_CONFIG
 from tests import TEST_GRAMPSHOME, ExampleDbSQLite
 
-with open(resource_filename("gramps_webapi", "data/apispec.yaml")) as file_handle:
-    API_SCHEMA = yaml.safe_load(file_handle)
+BASE_URL = "/api"
+
 
-API_RESOLVER = RefResolver(base_uri="", referrer=API_SCHEMA, store={"": API_SCHEMA})
+@lru_cache(maxsize=1)
+def get_api_schema():
+    """Return the parsed OpenAPI schema, loaded on first use.
+
+    Parsing the spec takes noticeable time, so it is deferred until a
+    schema check actually needs it instead of running at import in
+    every test process.
+    """
+    with open(
+        resource_filename("gramps_webapi", "data/apispec.yaml")
+    ) as file_handle:
+        return yaml.load(file_handle, Loader=SafeLoader)
+
+
+@lru_cache(maxsize=1)
+def get_api_resolver():
+    """Return a reference resolver for the OpenAPI schema."""
+    schema = get_api_schema()
+    return RefResolver(base_uri="", referrer=schema, store={"": schema})
 
-BASE_URL = "/api"
 
 TEST_USERS = {
     ROLE_OWNER: {"name": "owner", "password": "123"},
@@ -71,6 +95,25 @@ def setUpModule():
         test_app = create_app(db_manager=test_db)
     test_app.config["TESTING"] = True
     TEST_CLIENT = test_app.test_client()
+    # drop memoized GET responses whenever a request may mutate state
+    from .checks import clear_response_cache
+
+    original_open = TEST_CLIENT.open
+
+    def open_and_invalidate(*args, **kwargs):
+        method = kwargs.get("method", "GET")
+        path = args[0] if args and isinstance(args[0], str) else ""
+        if method != "GET" and not path.startswith(BASE_URL + "/token/"):
+            clear_response_cache()
+        return original_open(*args, **kwargs)
+
+    TEST_CLIENT.open = open_and_invalidate
+    # use a search index below the per-process temporary Gramps home so
+    # parallel test runs (pytest-xdist workers) don't share an index
+    test_app.config["SEARCH_INDEX_DIR"] = os.path.join(TEST_GRAMPSHOME, "indexdir")
+    test_app.config["SEARCH_INDEXER"] = SearchIndexer(
+        test_app.config["SEARCH_INDEX_DIR"]
+    )
     search_index = test_app.config["SEARCH_INDEXER"]
     db = test_db.get_db().db
     search_index.reindex_full(db)
@@ -20,24 +20,77 @@
 
 """Check functions for performing specific unit tests."""
 
-from jsonschema import validate
+import orjson
+from jsonschema.validators import validator_for
 
 from gramps_webapi.auth.const import ROLE_OWNER
 
-from . import API_RESOLVER, API_SCHEMA
+from . import get_api_resolver, get_api_schema
 from .util import check_keys_stripped, fetch_header
 
+# compiled validators per schema definition; jsonschema.validate would
+# re-check and re-compile the schema on every call
+_validator_cache = {}
+
+
+def get_schema_validator(name):
+    """Return a cached validator for a named schema definition."""
+    if name not in _validator_cache:
+        schema = get_api_schema()["definitions"][name]
+        validator_class = validator_for(schema)
+        validator_class.check_schema(schema)
+        _validator_cache[name] = validator_class(
+            schema, resolver=get_api_resolver()
+        )
+    return _validator_cache[name]
+
+
+# parsed JSON responses memoized per URL and role; the test fixture is
+# read-only for most of the suite, so identical GETs can share a result
+_response_cache = {}
+
+
+def clear_response_cache():
+    """Clear the memoized GET responses.
+
+    Called automatically by the shared test client after any request
+    that may mutate state.
+    """
+    _response_cache.clear()
+
+
+def parse_body(rv):
+    """Parse a test client response body."""
+    return orjson.loads(rv.data)
+
 
 def check_success(test, url, full=False, role=ROLE_OWNER):
     """Test that result returned successfully."""
+    cache_key = (url, role)
+    if not full and cache_key in _response_cache:
+        return _response_cache[cache_key]
     header = fetch_header(test.client, role=role)
     rv = test.client.get(url, headers=header)
     test.assertEqual(rv.status_code, 200)
     if not full:
-        return rv.json
+        _response_cache[cache_key] = parse_body(rv)
+        return _response_cache[cache_key]
     return rv
 
 
+def check_json_equal(test, first, second):
+    """Test that two JSON-serializable objects are equal.
+
+    Comparing canonicalized bytes is much cheaper than a recursive
+    assertEqual on large nested structures; on mismatch fall back to
+    assertEqual for a readable diff.
+    """
+    if orjson.dumps(first, option=orjson.OPT_SORT_KEYS) != orjson.dumps(
+        second, option=orjson.OPT_SORT_KEYS
+    ):
+        test.assertEqual(first, second)
+
+
 def check_invalid_syntax(test, url, role=ROLE_OWNER):
     """Test that invalid syntax is handled properly."""
     header = fetch_header(test.client, role=role)
@@ -75,7 +128,7 @@ def check_requires_token(test, url, role=ROLE_OWNER):
     header = fetch_header(test.client, role=role)
     rv = test.client.get(url, headers=header)
     test.assertEqual(rv.status_code, 200)
-    return rv.json
+    return parse_body(rv)
 
 
 def check_conforms_to_schema(test, url, name, role=ROLE_OWNER):
@@ -83,20 +136,14 @@ def check_conforms_to_schema(test, url, name, role=ROLE_OWNER):
     header = fetch_header(test.client, role=role)
     rv = test.client.get(url, headers=header)
     test.assertEqual(rv.status_code, 200)
-    if isinstance(rv.json, type([])):
-        for item in rv.json:
-            validate(
-                instance=item,
-                schema=API_SCHEMA["definitions"][name],
-                resolver=API_RESOLVER,
-            )
+    body = parse_body(rv)
+    validator = get_schema_validator(name)
+    if isinstance(body, type([])):
+        for item in body:
+            validator.validate(item)
     else:
-        validate(
-            instance=rv.json,
-            schema=API_SCHEMA["definitions"][name],
-            resolver=API_RESOLVER,
-        )
-    return rv.json
+        validator.validate(body)
+    return body
 
 
 def check_totals(test, url, total, role=ROLE_OWNER):
@@ -104,25 +151,27 @@ def check_totals(test, url, total, role=ROLE_OWNER):
     header = fetch_header(test.client, role=role)
     rv = test.client.get(url, headers=header)
     test.assertEqual(rv.status_code, 200)
-    test.assertIsInstance(rv.json, type([]))
-    test.assertEqual(len(rv.json), total)
+    body = parse_body(rv)
+    test.assertIsInstance(body, type([]))
+    test.assertEqual(len(body), total)
     count = rv.headers.pop("X-Total-Count")
     test.assertEqual(count, str(total))
-    return rv.json
+    return body
 
 
 def check_strip_parameter(test, url, join="?", role=ROLE_OWNER):
     """Test that strip parameter produces expected result."""
     header = fetch_header(test.client, role=role)
-    baseline = test.client.get(url, headers=header)
+    baseline = parse_body(test.client.get(url, headers=header))
     rv = test.client.get("{}{}strip=1".format(url, join), headers=header)
     test.assertEqual(rv.status_code, 200)
-    if isinstance(rv.json, type([])):
-        for item in baseline.json:
-            check_keys_stripped(test, item, rv.json[baseline.json.index(item)])
+    body = parse_body(rv)
+    if isinstance(body, type([])):
+        for item in baseline:
+            check_keys_stripped(test, item, body[baseline.index(item)])
     else:
-        check_keys_stripped(test, baseline.json, rv.json)
-    return rv.json
+        check_keys_stripped(test, baseline, body)
+    return body
 
 
 def check_keys_parameter(test, url, keys, join="?", role=ROLE_OWNER):
@@ -132,16 +181,17 @@ def check_keys_parameter(test, url, keys, join="?", role=ROLE_OWNER):
         size = len(key.split(","))
         rv = test.client.get("{}{}keys={}".format(url, join, key), headers=header)
         test.assertEqual(rv.status_code, 200)
-        if isinstance(rv.json, type([])):
-            for item in rv.json:
+        body = parse_body(rv)
+        if isinstance(body, type([])):
+            for item in body:
                 test.assertEqual(len(item), size)
                 for part in key.split(","):
                     test.assertIn(part, item)
         else:
-            test.assertEqual(len(rv.json), size)
+            test.assertEqual(len(body), size)
             for part in key.split(","):
-                test.assertIn(part, rv.json)
-    return rv.json
+                test.assertIn(part, body)
+    return body
 
 
 def check_skipkeys_parameter(test, url, keys, join="?", role=ROLE_OWNER):
@@ -149,23 +199,25 @@ def check_skipkeys_parameter(test, url, keys, join="?", role=ROLE_OWNER):
     header = fetch_header(test.client, role=role)
     rv = test.client.get(url, headers=header)
     test.assertEqual(rv.status_code, 200)
-    key_count = len(rv.json)
-    if isinstance(rv.json, type([])):
-        key_count = len(rv.json[0])
+    body = parse_body(rv)
+    key_count = len(body)
+    if isinstance(body, type([])):
+        key_count = len(body[0])
     for key in keys:
         size = key_count - len(key.split(","))
         rv = test.client.get("{}{}skipkeys={}".format(url, join, key), headers=header)
         test.assertEqual(rv.status_code, 200)
-        if isinstance(rv.json, type([])):
-            for item in rv.json:
+        body = parse_body(rv)
+        if isinstance(body, type([])):
+            for item in body:
                 test.assertEqual(len(item), size)
                 for part in key.split(","):
                     test.assertNotIn(part, item)
         else:
-            test.assertEqual(len(rv.json), size)
+            test.assertEqual(len(body), size)
             for part in key.split(","):
-                test.assertNotIn(part, rv.json)
-    return rv.json
+                test.assertNotIn(part, body)
+    return body
 
 
 def check_paging_parameters(test, url, size, join="?", role=ROLE_OWNER):
@@ -175,25 +227,28 @@ def check_paging_parameters(test, url, size, join="?", role=ROLE_OWNER):
         "{}{}page=1&pagesize={}".format(url, join, size), headers=header
     )
     test.assertEqual(rv.status_code, 200)
-    test.assertIsInstance(rv.json, type([]))
-    test.assertEqual(len(rv.json), size)
-    first = rv.json[0]
+    body = parse_body(rv)
+    test.assertIsInstance(body, type([]))
+    test.assertEqual(len(body), size)
+    first = body[0]
     rv = test.client.get(
         "{}{}page=2&pagesize={}".format(url, join, size), headers=header
     )
     test.assertEqual(rv.status_code, 200)
-    test.assertIsInstance(rv.json, type([]))
-    test.assertEqual(len(rv.json), size)
-    last = rv.json[-1]
+    body = parse_body(rv)
+    test.assertIsInstance(body, type([]))
+    test.assertEqual(len(body), size)
+    last = body[-1]
     rv = test.client.get(
         "{}{}page=1&pagesize={}".format(url, join, size * 2), headers=header
     )
     test.assertEqual(rv.status_code, 200)
-    test.assertIsInstance(rv.json, type([]))
-    test.assertEqual(len(rv.json), size * 2)
-    test.assertEqual(rv.json[0], first)
-    test.assertEqual(rv.json[-1], last)
-    return rv.json
+    body = parse_body(rv)
+    test.assertIsInstance(body, type([]))
+    test.assertEqual(len(body), size * 2)
+    test.assertEqual(body[0], first)
+    test.assertEqual(body[-1], last)
+    return body
 
 
 def check_sort_parameter(
@@ -215,18 +270,19 @@ def check_sort_parameter(
         headers=header,
     )
     test.assertEqual(rv.status_code, 200)
-    test.assertIsInstance(rv.json, type([]))
-    if len(rv.json) > 1:
+    body = parse_body(rv)
+    test.assertIsInstance(body, type([]))
+    if len(body) > 1:
         index = 1
         if direction == "+":
-            for item in rv.json[:-1]:
-                test.assertLessEqual(item[item_key], rv.json[index][item_key])
+            for item in body[:-1]:
+                test.assertLessEqual(item[item_key], body[index][item_key])
                 index = index + 1
         else:
-            for item in rv.json[:-1]:
-                test.assertGreaterEqual(item[item_key], rv.json[index][item_key])
+            for item in body[:-1]:
+                test.assertGreaterEqual(item[item_key], body[index][item_key])
                 index = index + 1
-    return rv.json
+    return body
 
 
 def check_single_extend_parameter(
@@ -263,12 +319,36 @@ def check_single_extend_parameter(
         "{}{}extend={}&keys={},extended".format(url, join, key, key), headers=header
     )
     test.assertEqual(rv.status_code, 200)
-    if isinstance(rv.json, type([])):
-        for item in rv.json:
+    body = parse_body(rv)
+    if isinstance(body, type([])):
+        for item in body:
             validate_item(test, item, key, extended_key, reference)
     else:
-        validate_item(test, rv.json, key, extended_key, reference)
-    return rv.json
+        validate_item(test, body, key, extended_key, reference)
+    return body
+
+
+def check_extended_key(test, item, key, extended_key, reference=False):
+    """Test that an extended key matches its handle list in a fetched object.
+
+    Unlike `check_single_extend_parameter`, this validates a key in an
+    object that has already been fetched (e.g. once with `extend=all`),
+    so a group of keys can be checked without one request per key.
+    """
+    if isinstance(item[key], type([])):
+        test.assertEqual(len(item[key]), len(item["extended"][extended_key]))
+        for extended_item in item["extended"][extended_key]:
+            if not reference:
+                test.assertIn(extended_item["handle"], item[key])
+            else:
+                found = False
+                for reference_item in item[key]:
+                    if reference_item["ref"] == extended_item["handle"]:
+                        found = True
+                        break
+                test.assertTrue(found)
+    else:
+        test.assertEqual(item["extended"][extended_key]["handle"], item[key])
 
 
 def check_boolean_parameter(test, url, variable, join="?", role=ROLE_OWNER):
@@ -276,19 +356,21 @@ def check_boolean_parameter(test, url, variable, join="?", role=ROLE_OWNER):
     header = fetch_header(test.client, role=role)
     rv = test.client.get("{}{}{}=0".format(url, join, variable), headers=header)
     test.assertEqual(rv.status_code, 200)
-    if isinstance(rv.json, type([])):
-        for item in rv.json:
+    body = parse_body(rv)
+    if isinstance(body, type([])):
+        for item in body:
             test.assertNotIn(variable, item)
     else:
-        test.assertNotIn(variable, rv.json)
+        test.assertNotIn(variable, body)
     rv = test.client.get("{}{}{}=1".format(url, join, variable), headers=header)
     test.assertEqual(rv.status_code, 200)
-    if isinstance(rv.json, type([])):
-        for item in rv.json:
+    body = parse_body(rv)
+    if isinstance(body, type([])):
+        for item in body:
             test.assertIn(variable, item)
     else:
-        test.assertIn(variable, rv.json)
-    return rv.json
+        test.assertIn(variable, body)
+    return body
 
 
 def check_filter_create_update_delete(test, base_url, test_url, namespace):
@@ -22,17 +22,16 @@
 
 import unittest
 
-from jsonschema import validate
-
 from gramps_webapi.const import GRAMPS_NAMESPACES
 
-from . import API_RESOLVER, API_SCHEMA, BASE_URL, get_test_client
+from . import BASE_URL, get_test_client
 from .checks import (
     check_filter_create_update_delete,
     check_invalid_semantics,
     check_requires_token,
     check_resource_missing,
     check_success,
+    get_schema_validator,
 )
 
 TEST_URL = BASE_URL + "/filters/"
@@ -55,11 +54,7 @@ class TestAllFilters(unittest.TestCase):
         rv = check_success(self, TEST_URL)
         for namespace in GRAMPS_NAMESPACES:
             self.assertIn(namespace, rv)
-            validate(
-                instance=rv[namespace],
-                schema=API_SCHEMA["definitions"]["NamespaceFilters"],
-                resolver=API_RESOLVER,
-            )
+            get_schema_validator("NamespaceFilters").validate(rv[namespace])
 
     def test_get_filters_validate_sematics(self):
         """Test invalid parameters and values."""
@@ -104,11 +99,7 @@ class TestFilters(unittest.TestCase):
         for namespace in GRAMPS_NAMESPACES:
             rv = check_success(self, TEST_URL + namespace)
             for rule in rv["rules"]:
-                validate(
-                    instance=rule,
-                    schema=API_SCHEMA["definitions"]["FilterRuleDescription"],
-                    resolver=API_RESOLVER,
-                )
+                get_schema_validator("FilterRuleDescription").validate(rule)
 
     def test_get_filters_namespace_rules_validate_semantics(self):
         """Test invalid rule parameter for each namespace."""
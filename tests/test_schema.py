@@ -26,16 +26,25 @@ import yaml
 from jsonschema import Draft4Validator, validate
 from pkg_resources import resource_filename
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class TestSchema(unittest.TestCase):
     """Test cases to validate schema format."""
 
-    def test_schema(self):
-        """Check schema for validity."""
+    @classmethod
+    def setUpClass(cls):
+        """Parse the schema once for all test cases."""
         # check it loads okay
         with open(
             resource_filename("gramps_webapi", "data/apispec.yaml")
         ) as file_handle:
-            api_schema = yaml.safe_load(file_handle)
+            cls.api_schema = yaml.load(file_handle, Loader=SafeLoader)
+
+    def test_schema(self):
+        """Check schema for validity."""
         # check structure
-        Draft4Validator.check_schema(api_schema)
+        Draft4Validator.check_schema(self.api_schema)